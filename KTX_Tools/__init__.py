@@ -0,0 +1,2601 @@
+# ##### BEGIN GPL LICENSE BLOCK #####
+#
+#  This program is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU General Public License
+#  as published by the Free Software Foundation; either version 2
+#  of the License, or (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public License
+#  along with this program; if not, write to the Free Software Foundation,
+#  Inc., 51 Franklin Street, Fifth Floor, Boston, MA 02110-1301, USA.
+#
+# ##### END GPL LICENSE BLOCK #####
+
+import bpy
+import mathutils
+import math
+import bmesh
+from mathutils import Vector
+from rna_prop_ui import PropertyPanel
+import os
+import stat
+import time
+import sys
+import functools
+import zlib
+from fractions import Fraction
+import numpy as np
+
+# ktx_expressions holds the bpy free expression helpers. It is imported as a
+# top level module from this folder, so the spawned workers of the KTX
+# Function "Multi Process" option import only that module, not the add-on
+if os.path.dirname(__file__) not in sys.path:
+    sys.path.append(os.path.dirname(__file__))
+from ktx_expressions import (EXPR_ERRSTATE, compile_expression, eval_expression,
+                             eval_vectorized, eval_rows, eval_lattice)
+
+bl_info = {
+    "name": "KTX Tools",
+    "description": "Various mesh/material creation tools",
+    "author": "Roel Koster, @koelooptiemanna, irc:kostex",
+    "version": (3, 7, 7),
+    "blender": (2, 80, 0),
+    "location": "",
+    "warning": "",
+    "wiki_url": "https://github.com/kostex/blenderscripts/",
+    #    "tracker_url": "https://developer.blender.org/maniphest/task/edit/form/2/",
+    "category": "Mesh"}
+
+
+EDIT_MODES = {'EDIT_MESH', 'EDIT_CURVE', 'EDIT_SURFACE',
+              'EDIT_METABALL', 'EDIT_TEXT', 'EDIT_ARMATURE'}
+
+
+TILED_MIN_POINTS = 10000
+
+# (workers, pool) of evaluate_tiled, kept between calls so the adaptive grid
+# doesn't start a pool per refinement step, shut down in unregister
+tiled_pool = None
+
+
+def get_tiled_pool(workers):
+    global tiled_pool
+    import concurrent.futures
+    import multiprocessing
+    if tiled_pool and tiled_pool[0] != workers:
+        shutdown_tiled_pool()
+    if tiled_pool is None:
+        # spawned workers start a plain python that only imports ktx_expressions
+        pool = concurrent.futures.ProcessPoolExecutor(
+            workers, mp_context=multiprocessing.get_context('spawn'))
+        tiled_pool = (workers, pool)
+    return tiled_pool[1]
+
+
+def shutdown_tiled_pool():
+    global tiled_pool
+    if tiled_pool:
+        tiled_pool[1].shutdown()
+        tiled_pool = None
+
+
+def evaluate_tiled(text, start, step, i, j, workers):
+    # Split the points in bands and evaluate them in the process pool. A full
+    # grid (i one row of columns, j one column of consecutive rows) is sent
+    # as row ranges, scattered lattice points as slices of i and j
+    if workers < 1:
+        workers = os.cpu_count() or 1
+    # before 2.91 sys.executable is Blender itself, which can't run workers
+    if workers == 1 or sys.executable == bpy.app.binary_path:
+        return eval_lattice(text, start, step, i, j)
+    pool = get_tiled_pool(workers)
+    if i.ndim == 2 and i.shape[0] == 1 and j.shape[1] == 1:
+        bands = np.array_split(j[:, 0], min(len(j), workers * 4))
+        jobs = [pool.submit(eval_rows, text, start, step, i.shape[1], (int(b[0]), int(b[-1]) + 1))
+                for b in bands]
+    else:
+        bands = min(len(i), workers * 4)
+        jobs = [pool.submit(eval_lattice, text, start, step, u, v)
+                for u, v in zip(np.array_split(i, bands), np.array_split(j, bands))]
+    return np.concatenate([job.result() for job in jobs])
+
+
+def evaluate_function(text, start, step, i, j, vectorize=True, tiled=False, workers=0):
+    # z of the function at x, y = start + step * (i, j), for integer lattice
+    # arrays i and j that broadcast together
+    z = None
+    if vectorize:
+        z = eval_vectorized(compile_expression(text, ('x', 'y')),
+                            x=start[0] + step[0] * i, y=start[1] + step[1] * j)
+    if z is None:
+        if tiled and np.broadcast(i, j).size >= TILED_MIN_POINTS:
+            z = evaluate_tiled(text, start, step, i, j, workers)
+        else:
+            z = eval_lattice(text, start, step, i, j)
+    return z
+
+
+def adaptive_grid(height, stepsx, stepsy, depth, tolerance):
+    # Quadtree refinement of a stepsx x stepsy grid. Cells live on an integer
+    # lattice 2**depth times finer than the grid and are split while the
+    # surface deviates more than tolerance from the bilinear patch through
+    # their corners. height(i, j) returns z for lattice coordinate arrays.
+    # Returns the lattice coordinates of the vertices, their z values and
+    # (loops, totals) of the leaf polygons. Vertices of finer neighbours are
+    # inserted in the sides of coarser cells, so the mesh has no cracks.
+    size = 1 << depth
+    cj, ci = np.divmod(np.arange(stepsx * stepsy), stepsx)
+    cells = np.stack((ci, cj), axis=-1) * size
+    leaves = []
+    while len(cells):
+        if size == 1:
+            leaves.append((cells, size))
+            break
+        h = size // 2
+        i, j = cells[:, 0], cells[:, 1]
+        z00, z10, z11, z01 = height(i, j), height(i + size, j), height(i + size, j + size), height(i, j + size)
+        err = np.abs(height(i + h, j + h) - (z00 + z10 + z11 + z01) / 4)
+        err = np.maximum(err, np.abs(height(i + h, j) - (z00 + z10) / 2))
+        err = np.maximum(err, np.abs(height(i + size, j + h) - (z10 + z11) / 2))
+        err = np.maximum(err, np.abs(height(i + h, j + size) - (z11 + z01) / 2))
+        err = np.maximum(err, np.abs(height(i, j + h) - (z01 + z00) / 2))
+        split = ~(err <= tolerance)
+        leaves.append((cells[~split], size))
+        cells = cells[split]
+        cells = np.concatenate((cells, cells + (h, 0), cells + (0, h), cells + (h, h)))
+        size = h
+
+    width = stepsx * (1 << depth) + 1
+    corners = set()
+    for cells, size in leaves:
+        for di, dj in ((0, 0), (size, 0), (size, size), (0, size)):
+            corners.update(((cells[:, 1] + dj) * width + cells[:, 0] + di).tolist())
+
+    def side(a, b, step):
+        # keys of the existing lattice points strictly between a and b
+        if step < 2:
+            return []
+        m = (a + b) // 2
+        if m not in corners:
+            return []
+        return side(a, m, step // 2) + [m] + side(m, b, step // 2)
+
+    loops = []
+    totals = []
+    for cells, size in leaves:
+        up = size * width
+        for k in ((cells[:, 1] * width) + cells[:, 0]).tolist():
+            a, b, c, d = k + up, k, k + size, k + size + up
+            poly = [a] + side(a, b, size) + [b] + side(b, c, size) + \
+                   [c] + side(c, d, size) + [d] + side(d, a, size)
+            loops.extend(poly)
+            totals.append(len(poly))
+
+    keys = np.array(sorted(corners), dtype=np.int64)
+    pj, pi = np.divmod(keys, width)
+    loops = np.searchsorted(keys, np.array(loops, dtype=np.int64))
+    return np.stack((pi, pj), axis=-1), height(pi, pj), (loops, totals)
+
+
+def evaluate_curve(code, t, **params):
+    # Evaluate a parametric expression over the sample array t (passed as
+    # variable 'a'), per sample when it can't be vectorized
+    v = eval_vectorized(code, a=t, **params)
+    if v is None:
+        with np.errstate(**EXPR_ERRSTATE):
+            v = np.array([eval_expression(code, a=float(a), **params) for a in t])
+    return v
+
+
+AUTO_MAX_SAMPLES = 1000000
+
+
+def common_period(frequencies, max_cycles=100):
+    # Smallest T > 0 for which every f * T is a whole number, so a curve
+    # made of terms cos(2 * pi * f * t) closes after t = T. Frequencies are
+    # taken as rationals; when that needs more than max_cycles turns of the
+    # slowest term they are approximated with ever smaller denominators.
+    # Returns None when all frequencies are zero.
+    frequencies = [abs(f) for f in frequencies if f]
+    if not frequencies:
+        return None
+    for max_denominator in (10000, 1000, 100, 10, 1):
+        fracs = [Fraction(f).limit_denominator(max_denominator) or Fraction(1, max_denominator)
+                 for f in frequencies]
+        numerator = functools.reduce(math.gcd, (f.numerator for f in fracs))
+        denominator = functools.reduce(lambda a, b: a * b // math.gcd(a, b),
+                                       (f.denominator for f in fracs))
+        period = denominator / numerator
+        if period * min(frequencies) <= max_cycles:
+            break
+    return period
+
+
+def sample_period(points, period, cycles, seglength):
+    # Parameter values covering one period of points(t) -> (n, 3) with
+    # segments of about seglength, the closing sample is left out
+    estimate = int(min(max(4096, 64 * cycles), AUTO_MAX_SAMPLES))
+    p = points(np.linspace(0.0, period, estimate, endpoint=False))
+    length = np.linalg.norm(np.diff(p, axis=0, append=p[:1]), axis=1).sum()
+    count = int(min(max(math.ceil(length / seglength), 3), AUTO_MAX_SAMPLES))
+    return np.linspace(0.0, period, count, endpoint=False)
+
+
+def simplify_polyline(points, tolerance, cyclic=False):
+    # Ramer-Douglas-Peucker: drop the points that are closer than tolerance
+    # to the simplified polyline. The end points (the first point of a
+    # cyclic polyline) are always kept
+    if tolerance <= 0 or len(points) < 3:
+        return points
+    if cyclic:
+        return simplify_polyline(np.concatenate((points, points[:1])), tolerance)[:-1]
+    keep = np.zeros(len(points), dtype=bool)
+    keep[0] = keep[-1] = True
+    stack = [(0, len(points) - 1)]
+    while stack:
+        i, j = stack.pop()
+        if j - i < 2:
+            continue
+        a = points[i]
+        ab = points[j] - a
+        ap = points[i + 1:j] - a
+        length2 = ab.dot(ab)
+        if length2 > 0:
+            t = np.clip(ap.dot(ab) / length2, 0.0, 1.0)
+            ap -= t[:, None] * ab
+        dist = np.einsum('ij,ij->i', ap, ap)
+        k = int(dist.argmax())
+        if dist[k] > tolerance * tolerance:
+            m = i + 1 + k
+            keep[m] = True
+            stack.append((i, m))
+            stack.append((m, j))
+    return points[keep]
+
+
+def polyline_edges(count, cyclic=False):
+    i = np.arange(count if cyclic else count - 1)
+    return np.stack((i, (i + 1) % count), axis=-1)
+
+
+POLYLINE_OUTPUTS = [("MESH", "Mesh", "Edge Mesh"),
+                    ("POLY", "Poly Curve", "Poly Spline Curve"),
+                    ("NURBS", "NURBS Curve", "NURBS Spline Curve")]
+
+
+def curve_from_points(name, points, spline_type='POLY', cyclic=False, bevel_depth=0.0, extrude=0.0):
+    cu = bpy.data.curves.new(name, 'CURVE')
+    cu.dimensions = '3D'
+    cu.bevel_depth = bevel_depth
+    cu.extrude = extrude
+    if not len(points):
+        return cu
+    spline = cu.splines.new(spline_type)
+    spline.points.add(len(points) - 1)
+    co = np.ones((len(points), 4), dtype=np.float32)
+    co[:, :3] = points
+    spline.points.foreach_set("co", co.ravel())
+    spline.use_cyclic_u = cyclic
+    if spline_type == 'NURBS':
+        spline.order_u = min(4, len(points))
+        spline.use_endpoint_u = not cyclic
+    return cu
+
+
+def polyline_data(name, points, output='MESH', cyclic=False, bevel_depth=0.0, extrude=0.0):
+    # Edge mesh or a single spline curve through points, output is one of
+    # POLYLINE_OUTPUTS
+    if output == 'MESH':
+        return mesh_from_arrays(bpy.data.meshes.new(name), points,
+                                edges=polyline_edges(len(points), cyclic))
+    return curve_from_points(name, points, output, cyclic, bevel_depth, extrude)
+
+
+class KTXPolylineOutputProps:
+    # Output settings of the operators that build a polyline through
+    # polyline_data (spiral, spirograph, Lissajous)
+    simplify : bpy.props.FloatProperty(name="Simplify",
+                                       description="Remove points closer than this to the simplified curve (0 = off)",
+                                       default=0.0, min=0.0, precision=4, step=0.1)
+    output : bpy.props.EnumProperty(name="Output",
+                                    description="Output an edge mesh or a curve",
+                                    items=POLYLINE_OUTPUTS)
+    bevel_depth : bpy.props.FloatProperty(name="Bevel Depth",
+                                          description="Curve Bevel Depth",
+                                          default=0.0, min=0.0, precision=4, step=0.1)
+    extrude : bpy.props.FloatProperty(name="Extrude",
+                                      description="Curve Extrude",
+                                      default=0.0, min=0.0, precision=4, step=0.1)
+
+    def draw_polyline(self, col):
+        col.prop(self, "simplify")
+        col.prop(self, "output")
+        if (self.output != "MESH"):
+            col.prop(self, "bevel_depth")
+            col.prop(self, "extrude")
+
+
+class KTXAutoPeriodProps:
+    # Closed period sampling of the spirograph and Lissajous, see
+    # common_period and sample_period
+    auto_period : bpy.props.BoolProperty(name="Auto Period",
+                                         description="Sample exactly one closed period of the curve",
+                                         default=False)
+    seglength : bpy.props.FloatProperty(name="Segment Length",
+                                        description="Target edge length in Auto Period mode",
+                                        default=0.01, min=0.0001, precision=4, step=0.1)
+
+
+CUBE_VERTS = np.array(((-1, -1, -1), (-1, -1, 1), (-1, 1, -1), (-1, 1, 1),
+                       (1, -1, -1), (1, -1, 1), (1, 1, -1), (1, 1, 1)), dtype=np.float64)
+CUBE_FACES = np.array(((0, 1, 3, 2), (4, 6, 7, 5), (0, 4, 5, 1),
+                       (2, 3, 7, 6), (0, 2, 6, 4), (1, 5, 7, 3)))
+
+
+def euler_matrices(rotations):
+    # (n, 3) XYZ euler angles -> (n, 3, 3) rotation matrices
+    (cx, cy, cz), (sx, sy, sz) = np.cos(rotations).T, np.sin(rotations).T
+    return np.stack((np.stack((cy * cz, sx * sy * cz - cx * sz, cx * sy * cz + sx * sz), axis=-1),
+                     np.stack((cy * sz, sx * sy * sz + cx * cz, cx * sy * sz - sx * cz), axis=-1),
+                     np.stack((-sy, sx * cy, cx * cy), axis=-1)), axis=-2)
+
+
+def boxes_mesh(mesh, locations, rotations, scales):
+    # Fill mesh with one cube (like primitive_cube_add) per transform
+    verts = np.einsum('nij,nkj->nki', euler_matrices(rotations),
+                      CUBE_VERTS[None, :, :] * np.asarray(scales)[:, None, :])
+    verts += np.asarray(locations)[:, None, :]
+    faces = CUBE_FACES[None] + 8 * np.arange(len(verts))[:, None, None]
+    return mesh_from_arrays(mesh, verts, faces=faces.reshape(-1, 4))
+
+
+def spaced_indices(locations, radii, count, grid=None, cell=None):
+    # Indices of the first count spheres (locations, radii) that don't
+    # overlap any sphere accepted before them, using a uniform spatial hash
+    # {cell: [(x, y, z, r), ...]} with cells at least as large as the largest
+    # sphere's diameter. Accepted spheres are added to grid, so passing the
+    # same grid (and cell) with the next batch only tests the new candidates
+    if cell is None:
+        cell = 2 * float(radii.max())
+    if grid is None:
+        grid = {}
+    accepted = []
+    keys = np.floor(locations / cell).astype(np.int64).tolist()
+    for i, (p, key, r) in enumerate(zip(locations.tolist(), keys, radii.tolist())):
+        free = True
+        for dx in (-1, 0, 1):
+            for dy in (-1, 0, 1):
+                for dz in (-1, 0, 1):
+                    for q in grid.get((key[0] + dx, key[1] + dy, key[2] + dz), ()):
+                        d = (p[0] - q[0]) ** 2 + (p[1] - q[1]) ** 2 + (p[2] - q[2]) ** 2
+                        if d < (r + q[3]) ** 2:
+                            free = False
+                            break
+                    if not free:
+                        break
+                if not free:
+                    break
+            if not free:
+                break
+        if free:
+            grid.setdefault(tuple(key), []).append((p[0], p[1], p[2], r))
+            accepted.append(i)
+            if len(accepted) == count:
+                break
+    return np.array(accepted, dtype=np.int64)
+
+
+def grid_faces(stepsx, stepsy):
+    # Quad loops of a (stepsx + 1) x (stepsy + 1) vertex grid, one row per face
+    w = stepsx + 1
+    i = (np.arange(stepsy)[:, None] * w + np.arange(stepsx)[None, :]).ravel()
+    return np.stack((i + w, i, i + 1, i + w + 1), axis=-1)
+
+
+def cylinders_mesh(mesh, centers, radii, depths, segments):
+    # Fill mesh with one capped cylinder per center, the equivalent of
+    # primitive_cylinder_add for each of them
+    centers = np.asarray(centers, dtype=np.float64).reshape(-1, 3)
+    count = len(centers)
+    radii = np.broadcast_to(radii, count)
+    depths = np.broadcast_to(depths, count)
+    angle = np.arange(segments) * (2 * math.pi / segments)
+    ring = np.stack((np.cos(angle), np.sin(angle), np.zeros(segments)), axis=-1)
+    verts = np.concatenate((ring - (0, 0, 1), ring + (0, 0, 1)))
+    verts = verts * np.stack((radii, radii, depths / 2), axis=-1)[:, None, :] + centers[:, None, :]
+
+    k = np.arange(segments)
+    sides = np.stack((k, (k + 1) % segments, (k + 1) % segments + segments, k + segments), axis=-1)
+    loops = np.concatenate((sides.ravel(), k + segments, k[::-1]))
+    totals = np.concatenate((np.full(segments, 4), (segments, segments)))
+    loops = (loops + (2 * segments) * np.arange(count)[:, None]).ravel()
+    return mesh_from_arrays(mesh, verts, faces=(loops, np.tile(totals, count)))
+
+
+def circles_curve(name, centers, radii, extrude=0.0):
+    # One curve holding a bezier circle spline per center, the equivalent of
+    # primitive_bezier_circle_add for each of them. Circles that don't share
+    # one z can't be filled, they become a 3D curve
+    centers = np.asarray(centers, dtype=np.float64).reshape(-1, 3)
+    radii = np.broadcast_to(radii, len(centers))
+    cu = bpy.data.curves.new(name, 'CURVE')
+    if len(centers) and np.ptp(centers[:, 2]) == 0:
+        cu.dimensions = '2D'
+        cu.fill_mode = 'BOTH'
+    else:
+        cu.dimensions = '3D'
+    cu.extrude = extrude
+    # four points with handles at the usual circle approximation distance
+    co = np.array(((1, 0, 0), (0, 1, 0), (-1, 0, 0), (0, -1, 0)), dtype=np.float64)
+    tangent = np.cross((0, 0, 1), co) * 0.5523
+    for center, radius in zip(centers, radii):
+        spline = cu.splines.new('BEZIER')
+        spline.bezier_points.add(3)
+        for attr, points in (("co", co), ("handle_left", co - tangent), ("handle_right", co + tangent)):
+            spline.bezier_points.foreach_set(attr, (points * radius + center).astype(np.float32).ravel())
+        spline.use_cyclic_u = True
+    return cu
+
+
+def mesh_from_arrays(mesh, verts, edges=None, faces=None):
+    # Fill an empty mesh in bulk. faces is either an (n, k) array or a
+    # (loops, totals) pair of flat arrays for mixed polygon sizes
+    verts = np.asarray(verts, dtype=np.float32).reshape(-1, 3)
+    mesh.vertices.add(len(verts))
+    mesh.vertices.foreach_set("co", verts.ravel())
+    if edges is not None:
+        edges = np.asarray(edges, dtype=np.int32).reshape(-1, 2)
+        mesh.edges.add(len(edges))
+        mesh.edges.foreach_set("vertices", edges.ravel())
+    if faces is not None:
+        if isinstance(faces, tuple):
+            loops, totals = faces
+            loops = np.asarray(loops, dtype=np.int32).ravel()
+            totals = np.asarray(totals, dtype=np.int32).ravel()
+        else:
+            faces = np.asarray(faces, dtype=np.int32)
+            loops = faces.ravel()
+            totals = np.full(len(faces), faces.shape[1], dtype=np.int32)
+        starts = np.zeros(len(totals), dtype=np.int32)
+        np.cumsum(totals[:-1], out=starts[1:])
+        mesh.loops.add(len(loops))
+        mesh.loops.foreach_set("vertex_index", loops)
+        mesh.polygons.add(len(totals))
+        mesh.polygons.foreach_set("loop_start", starts)
+        if not mesh.polygons.bl_rna.properties["loop_total"].is_readonly:
+            mesh.polygons.foreach_set("loop_total", totals)
+    mesh.update(calc_edges=faces is not None)
+    return mesh
+
+
+def copy_transforms(source, count):
+    # (count, 3) location, rotation and scale arrays filled with the
+    # transform of source, for the array tools to overwrite what they change
+    return tuple(np.tile(np.array(tuple(value), dtype=np.float64), (count, 1))
+                 for value in (source.location, source.rotation_euler, source.scale))
+
+
+def add_copies(source, locations, rotations, scales, linked=True):
+    # One copy of source per row of the transform arrays, put in the
+    # collections of source. Replaces object.duplicate, which re-evaluates
+    # the selection and the depsgraph for every copy
+    collections = source.users_collection or (bpy.context.scene.collection,)
+    copies = []
+    for location, rotation, scale in zip(np.asarray(locations).tolist(),
+                                         np.asarray(rotations).tolist(),
+                                         np.asarray(scales).tolist()):
+        obj = source.copy()
+        if not linked and source.data is not None:
+            obj.data = source.data.copy()
+        obj.location = location
+        obj.rotation_euler = rotation
+        obj.scale = scale
+        for coll in collections:
+            coll.objects.link(obj)
+        copies.append(obj)
+    return copies
+
+
+# Randomizers draw from their own numpy Generator, seeded with the
+# operator's seed and name, so results only depend on the seed and don't
+# change when something else uses the global random module
+def random_stream(seed, name):
+    return np.random.default_rng((seed, zlib.crc32(name.encode())))
+
+
+def random_transforms(rng, count, span, rotation, minsize, maxsize, uniformscale):
+    # (count, 3) locations within +-span, rotations within +-rotation and
+    # scales between minsize and maxsize
+    span = np.array(span)
+    rotation = np.array(rotation)
+    locations = rng.uniform(-span, span, (count, 3))
+    rotations = rng.uniform(-rotation, rotation, (count, 3))
+    scales = rng.uniform(minsize, maxsize, (count, 3))
+    if uniformscale:
+        scales[:, 1:] = scales[:, :1]
+    return locations, rotations, scales
+
+
+def hsv_to_rgb(hsv):
+    # colorsys.hsv_to_rgb for an (n, 3) array
+    h, s, v = hsv.T
+    i = np.floor(h * 6.0)
+    f = h * 6.0 - i
+    p, q, t = v * (1.0 - s), v * (1.0 - s * f), v * (1.0 - s * (1.0 - f))
+    i = i.astype(np.int64) % 6
+    return np.stack((np.choose(i, (v, q, p, p, t, v)),
+                     np.choose(i, (t, v, v, q, p, p)),
+                     np.choose(i, (p, p, t, v, v, q))), axis=-1)
+
+
+def random_colors(rng, count, rminmax, gminmax, bminmax, hsv=False):
+    # (count, 3) RGB colors, the min/max pairs are HSV ranges when hsv is set
+    low, high = np.array((rminmax, gminmax, bminmax)).T
+    colors = rng.uniform(low, high, (count, 3))
+    return hsv_to_rgb(colors) if hsv else colors
+
+
+def node_material(name):
+    # material with nodes, created when it doesn't exist yet
+    mat = bpy.data.materials.get(name) or bpy.data.materials.new(name)
+    mat.use_nodes = True
+    return mat
+
+
+def color_node(mat, cache=None):
+    # the diffuse or principled shader node giving mat its color. Pass a
+    # dict as cache to look up materials shared by many objects only once
+    if cache is not None and mat.name in cache:
+        return cache[mat.name]
+    found = None
+    if mat.node_tree:
+        for node in mat.node_tree.nodes:
+            if node.type == "BSDF_DIFFUSE" or node.type == "BSDF_PRINCIPLED":
+                found = node
+                break
+    if cache is not None:
+        cache[mat.name] = found
+    return found
+
+
+def object_color_material():
+    # one material for many objects, its color comes from Object.color
+    mat = node_material("KTX Object Color")
+    node = color_node(mat)
+    if node and not node.inputs[0].is_linked:
+        info = mat.node_tree.nodes.new('ShaderNodeObjectInfo')
+        info.location = (node.location.x - 250, node.location.y)
+        mat.node_tree.links.new(info.outputs['Color'], node.inputs[0])
+    return mat
+
+
+COPY_OUTPUTS = [("OBJECTS", "Objects", "One object per copy"),
+                ("INSTANCES", "Instances", "One object instancing the source on a point per copy")]
+
+
+def instance_node_group(source):
+    # Geometry nodes tree instancing source on the points of its geometry,
+    # rotated and scaled by the ktx_rotation/ktx_scale point attributes
+    ng = bpy.data.node_groups.new("KTX Instances", 'GeometryNodeTree')
+    if hasattr(ng, "interface"):
+        ng.interface.new_socket("Geometry", in_out='INPUT', socket_type='NodeSocketGeometry')
+        ng.interface.new_socket("Geometry", in_out='OUTPUT', socket_type='NodeSocketGeometry')
+    else:
+        ng.inputs.new('NodeSocketGeometry', "Geometry")
+        ng.outputs.new('NodeSocketGeometry', "Geometry")
+    nodes = ng.nodes
+    group_in = nodes.new('NodeGroupInput')
+    group_out = nodes.new('NodeGroupOutput')
+    info = nodes.new('GeometryNodeObjectInfo')
+    info.inputs['Object'].default_value = source
+    info.transform_space = 'ORIGINAL'
+    inst = nodes.new('GeometryNodeInstanceOnPoints')
+    ng.links.new(group_in.outputs[0], inst.inputs['Points'])
+    ng.links.new(info.outputs['Geometry'], inst.inputs['Instance'])
+    for attr, socket in (("ktx_rotation", 'Rotation'), ("ktx_scale", 'Scale')):
+        node = nodes.new('GeometryNodeInputNamedAttribute')
+        node.data_type = 'FLOAT_VECTOR'
+        node.inputs['Name'].default_value = attr
+        output = [o for o in node.outputs if o.enabled and o.type == 'VECTOR'][0]
+        ng.links.new(output, inst.inputs[socket])
+    ng.links.new(inst.outputs['Instances'], group_out.inputs[0])
+    group_in.location = (-400, 0)
+    info.location = (-400, -150)
+    group_out.location = (300, 0)
+    return ng
+
+
+def add_instances(source, locations, rotations, scales):
+    # One carrier object with a point per row of the transform arrays that
+    # instances source on them, so the scene holds one object whatever the
+    # count. Needs the named attribute node (Blender 3.2), returns None in
+    # older versions
+    if bpy.app.version < (3, 2, 0):
+        return None
+    me = bpy.data.meshes.new(source.name + " Instances")
+    mesh_from_arrays(me, locations)
+    for attr, values in (("ktx_rotation", rotations), ("ktx_scale", scales)):
+        me.attributes.new(attr, 'FLOAT_VECTOR', 'POINT').data.foreach_set(
+            "vector", np.asarray(values, dtype=np.float32).ravel())
+    obj = bpy.data.objects.new(me.name, me)
+    obj.modifiers.new("KTX Instances", 'NODES').node_group = instance_node_group(source)
+    for coll in source.users_collection or (bpy.context.scene.collection,):
+        coll.objects.link(obj)
+    return obj
+
+
+def add_output(source, locations, rotations, scales, output, linked, report):
+    # add_instances or add_copies by the COPY_OUTPUTS choice, falling back to
+    # copies (and reporting it) where instances aren't available
+    if output == "INSTANCES":
+        if add_instances(source, locations, rotations, scales):
+            return
+        report({'WARNING'}, "Instances need Blender 3.2 or newer, adding objects")
+    add_copies(source, locations, rotations, scales, linked)
+
+
+class KTXAssignRandomDiffuseColors(bpy.types.Operator):
+    bl_idname = "wm.ktx_assign_random_diffuse_colors"
+    bl_description = "Assign random diffuse colors"
+    bl_label = "Rnd Diff. Colors"
+    bl_options = {'REGISTER', 'UNDO'}
+
+    def ctype_options(self,context):
+        return [("RGB","RGB","Red Green Blue"),
+                ("HSV","HSV","Hue Saturation Value")]
+
+    random_seed : bpy.props.IntProperty(
+        name="Random Seed",
+        description="Seed value for the random generator",
+        min=0,
+        max=10000,
+        default=0)
+
+    def target_options(self,context):
+        return [("MATERIAL","Materials","Change the active material of each object"),
+                ("OBJECT","Object Color","Set Object Color, read by one shared material"),
+                ("PALETTE","Palette","Assign one of a few shared palette materials")]
+
+    rgb_or_hsv : bpy.props.EnumProperty(
+        name="Color Type",
+        description="RGB or HSV",
+        items=ctype_options)
+
+    target : bpy.props.EnumProperty(
+        name="Target",
+        description="Where the random colors go",
+        items=target_options)
+
+    palette_size : bpy.props.IntProperty(
+        name="Palette Size",
+        description="Number of palette materials",
+        min=1,
+        default=8)
+
+    rminmax : bpy.props.FloatVectorProperty(
+        size=2,
+        name="RH Min/Max Values",
+        description="Red or Hue Min/Max Values",
+        default=(0.0, 1.0), min=0.0, max=1.0)
+
+    gminmax : bpy.props.FloatVectorProperty(
+        size=2,
+        name="GS Min/Max Values",
+        description="Green or Saturation Min/Max Values",
+        default=(0.0, 1.0), min=0.0, max=1.0)
+
+    bminmax : bpy.props.FloatVectorProperty(
+        size=2,
+        name="BV Min/Max Values",
+        description="Blue or Value Min/Max Values",
+        default=(0.0, 1.0), min=0.0, max=1.0)
+
+    def execute(self, context):
+        # sorted, so the colors don't depend on the selection order
+        objects = sorted((obj for obj in bpy.context.selected_objects
+                          if obj.type == 'MESH' or obj.type == 'CURVE'), key=lambda obj: obj.name)
+        rng = random_stream(self.random_seed, self.bl_idname)
+        hsv = self.rgb_or_hsv == "HSV"
+
+        if self.target == "OBJECT":
+            colors = random_colors(rng, len(objects), self.rminmax, self.gminmax, self.bminmax, hsv)
+            mat = object_color_material()
+            for obj, col in zip(objects, colors.tolist()):
+                obj.color = (col[0], col[1], col[2], 1)
+                obj.active_material = mat
+            return {'FINISHED'}
+
+        if self.target == "PALETTE":
+            colors = random_colors(rng, self.palette_size, self.rminmax, self.gminmax, self.bminmax, hsv)
+            palette = []
+            for i, col in enumerate(colors.tolist()):
+                mat = node_material("KTX Palette " + str(i + 1).zfill(2))
+                node = color_node(mat)
+                if node:
+                    node.inputs[0].default_value = (col[0], col[1], col[2], 1)
+                mat.diffuse_color = (col[0], col[1], col[2], 1)
+                palette.append(mat)
+            for obj, i in zip(objects, rng.integers(0, self.palette_size, len(objects)).tolist()):
+                obj.active_material = palette[i]
+            return {'FINISHED'}
+
+        colors = random_colors(rng, len(objects), self.rminmax, self.gminmax, self.bminmax, hsv)
+        nodes = {}
+        for obj, col in zip(objects, colors.tolist()):
+            m = obj.active_material
+            if not m:
+                continue
+            node = color_node(m, nodes)
+            if node:
+                node.inputs[0].default_value = (col[0], col[1], col[2], 1)
+                m.diffuse_color = (col[0], col[1], col[2], 1)
+        return {'FINISHED'}
+
+
+class KTXAddRandomCubes(bpy.types.Operator):
+    bl_idname = "wm.ktx_add_random_cubes"
+    bl_description = "Add random cubes"
+    bl_label = "Rnd Cubes"
+    bl_options = {"REGISTER", "UNDO"}
+
+    random_seed : bpy.props.IntProperty(name="Random Seed",
+                                        description="Seed value for the random generator",
+                                        min=0,
+                                        max=10000,
+                                        default=0)
+
+    count : bpy.props.IntProperty(name="Count",
+                                  description="Number of Cubes",
+                                  default=20, min=1, soft_max=1000)
+
+    output : bpy.props.EnumProperty(name="Output",
+                                    description="One mesh or linked cube objects",
+                                    items=[("MESH","Mesh","One mesh holding all cubes"),
+                                           ("OBJECTS","Objects","One object per cube, all sharing one cube mesh")])
+
+    nooverlap : bpy.props.BoolProperty(name="No Overlap",
+                                       description="Keep the cubes apart (rejects cubes that could touch)",
+                                       default=False)
+
+    uniformscale : bpy.props.BoolProperty(name="UniScale",
+                                          description="Uniform Scale",
+                                          default=True)
+
+    minsize : bpy.props.FloatProperty(name="MinSize",
+                                      description="Minumum Cube Size",
+                                      default=0.1, min=0.01, max=20.0)
+
+    maxsize : bpy.props.FloatProperty(name="MaxSize",
+                                      description="Maximum Cube Size",
+                                      default=0.1, min=0.01, max=20.0)
+
+    span : bpy.props.FloatVectorProperty(name="Span",
+                                         description="Distribution Area",
+                                         default=(1.0, 1.0, 1.0), min=0.01, max=200.0)
+
+    rotation : bpy.props.FloatVectorProperty(name="Rotation",
+                                             description="Rotation",
+                                             default=(0.0, 0.0, 0.0), min=-3.141592, max=3.141592, subtype='EULER')
+
+    def execute(self, context):
+        rng = random_stream(self.random_seed, self.bl_idname)
+        # draw candidates in batches until enough of them are accepted, the
+        # spatial hash keeps the accepted cubes between batches. A cube spans
+        # -scale..scale, so its bounding sphere is |scale| <= sqrt(3) * maxsize
+        grid = {}
+        cell = 2 * math.sqrt(3) * max(self.minsize, self.maxsize)
+        locations, rotations, scales = [], [], []
+        missing = self.count
+        for attempt in range(30 if self.nooverlap else 1):
+            batch = random_transforms(rng, self.count, self.span, self.rotation,
+                                      self.minsize, self.maxsize, self.uniformscale)
+            if self.nooverlap:
+                keep = spaced_indices(batch[0], np.linalg.norm(batch[2], axis=1), missing, grid, cell)
+                batch = [b[keep] for b in batch]
+            locations.append(batch[0])
+            rotations.append(batch[1])
+            scales.append(batch[2])
+            missing -= len(batch[0])
+            if not missing:
+                break
+        locations = np.concatenate(locations)
+        rotations = np.concatenate(rotations)
+        scales = np.concatenate(scales)
+        if len(locations) < self.count:
+            self.report({'WARNING'}, "Only %d cubes fit without overlapping" % len(locations))
+
+        if self.output == "MESH":
+            me = boxes_mesh(bpy.data.meshes.new('Kuub'), locations, rotations, scales)
+            bpy.context.collection.objects.link(bpy.data.objects.new('Kuub', me))
+        elif len(locations):
+            me = mesh_from_arrays(bpy.data.meshes.new('Kuub'), CUBE_VERTS, faces=CUBE_FACES)
+            ob = bpy.data.objects.new('Kuub', me)
+            ob.location = locations[0]
+            ob.rotation_euler = rotations[0]
+            ob.scale = scales[0]
+            bpy.context.collection.objects.link(ob)
+            add_copies(ob, locations[1:], rotations[1:], scales[1:])
+        return {'FINISHED'}
+
+
+class KTXAddRandomCopies(bpy.types.Operator):
+    bl_idname = "wm.ktx_add_random_copies"
+    bl_description = "Add random copies of selected object"
+    bl_label = "Rnd Copies"
+    bl_options = {"REGISTER", "UNDO"}
+
+    random_seed : bpy.props.IntProperty(name="Random Seed",
+                                        description="Seed value for the random generator",
+                                        min=0,
+                                        max=10000,
+                                        default=0)
+
+    linkedcopy : bpy.props.BoolProperty(name="Linked",
+                                        description="Make a Linked copy",
+                                        default=False)
+    output : bpy.props.EnumProperty(name="Output",
+                                    description="Separate objects or one instancing object",
+                                    items=COPY_OUTPUTS)
+
+    count : bpy.props.IntProperty(name="Count",
+                                  description="Number of Cubes",
+                                  default=20, min=3, max=1000)
+
+    uniformscale : bpy.props.BoolProperty(name="UniScale",
+                                          description="Uniform Scale",
+                                          default=True)
+
+    minsize : bpy.props.FloatProperty(name="MinSize",
+                                      description="Minimum Size",
+                                      default=1.0, min=0.001, max=20.0)
+
+    maxsize : bpy.props.FloatProperty(name="MaxSize",
+                                      description="Maximum Size",
+                                      default=1.0, min=0.001, max=20.0)
+
+    span : bpy.props.FloatVectorProperty(name="Span",
+                                         description="Distribution Area",
+                                         default=(1.0, 1.0, 1.0), min=0.01, max=200.0)
+
+    rotation : bpy.props.FloatVectorProperty(name="Rotation",
+                                             description="Rotation",
+                                             default=(0.0, 0.0, 0.0), min=-3.141592, max=3.141592, subtype='EULER')
+
+    def execute(self, context):
+        obj = bpy.context.active_object
+        if obj:
+            locations, rotations, scales = random_transforms(
+                random_stream(self.random_seed, self.bl_idname), self.count - 1, self.span,
+                self.rotation, self.minsize, self.maxsize, self.uniformscale)
+            add_output(obj, locations, rotations, scales, self.output,
+                       self.linkedcopy, self.report)
+        return {'FINISHED'}
+
+
+class KTXAssignMaterials(bpy.types.Operator):
+    bl_idname = "wm.ktx_assign_materials"
+    bl_description = "Add default materials to selected objects"
+    bl_label = "Add Deflt Mtrls"
+    bl_options = {'REGISTER', 'UNDO'}
+
+    def execute(self, context):
+        for obj in bpy.context.selected_objects:
+            if (obj.type == 'MESH' or obj.type == 'CURVE'):
+                mat = bpy.data.materials.new(obj.name)
+                obj.active_material = mat
+                obj.material_slots[0].material.use_nodes = True
+        return {'FINISHED'}
+
+
+#class KTXAddGlossyMixShaders(bpy.types.Operator):
+#    bl_idname = "wm.ktx_add_glossy_mix_shaders"
+#    bl_description = "Add a glossy shader to current shader via mix shader node"
+#    bl_label = "Add G/M Shaders"
+#    bl_options = {'REGISTER', 'UNDO'}
+#
+#    def execute(self, context):
+#        unique_mats = []
+#        for obj in bpy.context.selected_objects:
+#            obj_mat_name = obj.material_slots[0].name
+#            if not obj_mat_name in unique_mats:
+#                unique_mats.append(obj_mat_name)
+#
+#        for mat in bpy.data.materials:
+#            if mat.name in unique_mats:
+#                tree = mat.node_tree
+#                nodes = tree.nodes
+#                links = tree.links
+#                nodes[0].location.x = nodes[0].location.x + 200
+#                node_glossy = nodes.new('ShaderNodeBsdfGlossy')
+#                node_glossy.location = (10, 150)
+#            node_mix.inputs[0].default_value = random.randint(0, 20) / 100
+#                links.new(nodes[1].outputs[0], node_mix.inputs[1])
+#                links.new(node_glossy.outputs[0], node_mix.inputs[2])
+#                links.new(node_mix.outputs[0], nodes[0].inputs[0])
+#        return {'FINISHED'}
+
+
+#class KTXAddSubsurfCreases(bpy.types.Operator):
+#    bl_idname = "wm.ktx_add_subsurf_creases"
+#    bl_description = "Add subsurface modifier to selected objects and assign crease value"
+#    bl_label = "Add SubSurf Crsd"
+#    bl_options = {'REGISTER', 'UNDO'}
+#
+#    sub : bpy.props.BoolProperty(name="Sub Surface",
+#                                 description="Add Sub Surface",
+#                                 default=False)
+#
+#    viewlevels : bpy.props.IntProperty(name="View Levels",
+#                                       description="Viewport Levels",
+#                                       default=3, min=1, max=4)
+#
+#    renderlevels : bpy.props.IntProperty(name="Render Levels",
+#                                         description="Render Levels",
+#                                         default=3, min=1, max=4)
+#
+#    creasevalue : bpy.props.FloatProperty(name="Crease Value",
+#                                          description="Crease Value",
+#                                          default=0.9, min=0.0, max=1.0)
+#
+#    def execute(self, context):
+#        for obj in bpy.data.objects:
+#            if obj.type == 'MESH':
+#                if self.sub:
+#                    mod1 = obj.modifiers.new('sub', 'SUBSURF')
+#                    mod1.render_levels = self.renderlevels
+#                for i in obj.data.edges:
+#                    i.crease = self.creasevalue
+#        return {'FINISHED'}
+
+
+class KTXSetViewportColor(bpy.types.Operator):
+    bl_idname = "wm.ktx_set_viewport_color"
+    bl_description = "Set viewport color to the diffuse shader color"
+    bl_label = "Set View Color"
+    bl_options = {'REGISTER', 'UNDO'}
+
+    def execute(self, context):
+        obj = bpy.context.active_object
+        if obj and obj.active_material:
+            node = color_node(obj.active_material)
+            if node:
+                col = node.inputs[0].default_value
+                obj.active_material.diffuse_color = (col[0], col[1], col[2], 1)
+        return {'FINISHED'}
+
+
+class KTXSyncViewportColors(bpy.types.Operator):
+    bl_idname = "wm.ktx_sync_viewport_colors"
+    bl_description = "Set viewport color to the diffuse shader color for all materials of the selected objects"
+    bl_label = "Sync View Colors"
+    bl_options = {'REGISTER', 'UNDO'}
+
+    def execute(self, context):
+        # every material once, however many objects share it
+        materials = {}
+        for obj in bpy.context.selected_objects:
+            for slot in obj.material_slots:
+                if slot.material:
+                    materials[slot.material.name] = slot.material
+        for mat in materials.values():
+            node = color_node(mat)
+            if node:
+                col = node.inputs[0].default_value
+                mat.diffuse_color = (col[0], col[1], col[2], 1)
+        return {'FINISHED'}
+
+
+#class KTXEraseAllMaterials(bpy.types.Operator):
+#    bl_idname = "wm.ktx_erase_all_materials"
+#    bl_description = "Erase all unused materials"
+#    bl_label = "Erase Unused Mtrls"
+#    bl_options = {'REGISTER', 'UNDO'}
+#
+#    def execute(self, context):
+#        bmat = bpy.data.materials
+#        for mat in bmat:
+#            #      mat.use_fake_user=False
+#            if mat.users < 1:
+#                bmat.remove(mat)
+#        return {'FINISHED'}
+
+
+#class KTXEraseUnusedTextures(bpy.types.Operator):
+#    bl_idname = "wm.ktx_erase_unused_textures"
+#    bl_description = "Erase unused textures"
+#    bl_label = "Erase Unused Txtrs"
+#    bl_options = {'REGISTER', 'UNDO'}
+#
+#    def execute(self, context):
+#        img_names = []
+#        textures = bpy.data.textures
+#        for tex in textures:
+#            if tex.type == 'IMAGE':
+#                img_names.append(tex.image.name)
+#        imgs = bpy.data.images
+#        for image in imgs:
+#            if name not in img_names:
+#                image.user_clear()
+#        return {'FINISHED'}
+
+
+#class KTXEraseUnusedPalettes(bpy.types.Operator):
+#    bl_idname = "wm.ktx_erase_unused_palettes"
+#    bl_description = "Erase unused palettes"
+#    bl_label = "Erase Unused Palettes"
+#    bl_options = {'REGISTER', 'UNDO'}
+#
+#    def execute(self, context):
+#        bpal = bpy.data.palettes
+#        for pal in bpal:
+#            pal.use_fake_user = False
+#            if pal.users < 1:
+#                bpal.remove(pal)
+#        return {'FINISHED'}
+
+
+class KTXFunction(bpy.types.Operator):
+    bl_idname = "wm.ktx_function"
+    bl_description = "Function plotter"
+    bl_label = "KTX Function"
+    bl_options = {'REGISTER', 'UNDO'}
+
+    startx : bpy.props.FloatProperty(name="X min",
+                                     description="X minimum value",
+                                     default=-math.pi)
+    endx : bpy.props.FloatProperty(name="X max",
+                                   description="X maximum value",
+                                   default=math.pi)
+    starty : bpy.props.FloatProperty(name="Y min",
+                                     description="Y minimum value",
+                                     default=-math.pi)
+    endy : bpy.props.FloatProperty(name="Y max",
+                                   description="Y maximum value",
+                                   default=math.pi)
+    stepsx : bpy.props.IntProperty(name="Faces along X",
+                                   description="How many faces in X direction",
+                                   default=20)
+    stepsy : bpy.props.IntProperty(name="Faces along Y",
+                                   description="How many faces in Y direction",
+                                   default=20)
+    func : bpy.props.StringProperty(name="Function",
+                                    description="Function to evaluate",
+                                    default="math.sin(x)*math.cos(y)")
+    vectorize : bpy.props.BoolProperty(name="Vectorize",
+                                       description="Evaluate the function on the whole grid at once (falls back to per vertex evaluation)",
+                                       default=True)
+    adaptive : bpy.props.BoolProperty(name="Adaptive",
+                                      description="Only subdivide the faces where the surface is curved",
+                                      default=False)
+    tolerance : bpy.props.FloatProperty(name="Tolerance",
+                                        description="Maximum height deviation of an undivided face",
+                                        default=0.01, min=0.00001, precision=5, step=0.1)
+    maxdepth : bpy.props.IntProperty(name="Max Subdivisions",
+                                     description="Maximum number of times a face gets divided",
+                                     default=4, min=0, max=10)
+    tiled : bpy.props.BoolProperty(name="Multi Process",
+                                   description="Evaluate functions that can't be vectorized in parallel row bands",
+                                   default=False)
+    workers : bpy.props.IntProperty(name="Processes",
+                                    description="Number of worker processes (0 = one per CPU)",
+                                    default=0, min=0)
+    reuse : bpy.props.BoolProperty(name="Update Active",
+                                   description="Update the active KTX Function object in place, keeping its mesh when the grid size is unchanged",
+                                   default=False)
+
+    def execute(self, context):
+        incx = (self.endx - self.startx) / self.stepsx
+        incy = (self.endy - self.starty) / self.stepsy
+
+        try:
+            compile_expression(self.func, ('x', 'y'))
+        except ValueError as err:
+            self.report({'ERROR'}, str(err))
+            return {'CANCELLED'}
+
+        # the mesh keeps the grid it was built with, (stepsx, stepsy, adaptive)
+        grid = (self.stepsx, self.stepsy, int(self.adaptive))
+        target = context.active_object
+        if not (self.reuse and target and target.type == 'MESH' and 'ktx_function' in target.data):
+            target = None
+
+        start = (self.startx, self.starty)
+        try:
+            if self.adaptive:
+                scale = 1 << self.maxdepth
+                step = (incx / scale, incy / scale)
+
+                def height(i, j):
+                    return evaluate_function(self.func, start, step, i, j,
+                                             self.vectorize, self.tiled, self.workers)
+
+                points, gz, faces = adaptive_grid(height, self.stepsx, self.stepsy,
+                                                  self.maxdepth, self.tolerance)
+                gx = self.startx + points[:, 0] * step[0]
+                gy = self.starty + points[:, 1] * step[1]
+            else:
+                i = np.arange(self.stepsx + 1)[None, :]
+                j = np.arange(self.stepsy + 1)[:, None]
+                gz = evaluate_function(self.func, start, (incx, incy), i, j,
+                                       self.vectorize, self.tiled, self.workers)
+                gx, gy = np.broadcast_arrays(self.startx + incx * i, self.starty + incy * j)
+                faces = grid_faces(self.stepsx, self.stepsy)
+        except ValueError as err:
+            self.report({'ERROR'}, str(err))
+            return {'CANCELLED'}
+        verts = np.stack((gx, gy, gz), axis=-1)
+
+        if target and not self.adaptive and tuple(target.data['ktx_function']) == grid \
+                and len(target.data.vertices) == len(verts.reshape(-1, 3)):
+            # same topology, only the coordinates change
+            target.data.vertices.foreach_set("co", verts.astype(np.float32).ravel())
+            target.data.update()
+            return {'FINISHED'}
+
+        msh = bpy.data.meshes.new('KTX Function')
+        mesh_from_arrays(msh, verts, faces=faces)
+        msh['ktx_function'] = grid
+        if target:
+            old = target.data
+            target.data = msh
+            if old.users == 0:
+                bpy.data.meshes.remove(old)
+        else:
+            obj = bpy.data.objects.new('KTX Function', msh)
+            context.scene.collection.objects.link(obj)
+            for ob in context.selected_objects:
+                ob.select_set(False)
+            obj.select_set(True)
+            context.view_layer.objects.active = obj
+        return {'FINISHED'}
+
+
+class KTXCylinders(bpy.types.Operator):
+    bl_idname = "wm.ktx_cylinders"
+    bl_description = "Add cylinder 'stairs'"
+    bl_label = "KTX Cylinders"
+    bl_options = {'REGISTER', 'UNDO'}
+
+    def type_options(self,context):
+        return [("CURVE","Curve","Set Type to Curve"),("MESH","Mesh","Set Type to Mesh")]
+
+    def mode_options(self,context):
+        return [("INCREMENT","Increment","Increment with Factor"),("MULTIPLICATION","Multiplication","Multiply by Factor")]
+
+    def height_options(self,context):
+        return [("TOP","Top","Align to Top"),("CENTER","Center","Align to Center"),("BOTTOM","Bottom","Align to Bottom")]
+
+    type : bpy.props.EnumProperty(name="Mesh/Curve",
+                                  description="Mesh or Curve Mode",
+                                  items=type_options)
+    startrad : bpy.props.FloatProperty(name="Start Radius",
+                                       description="Cylinder Start Radius",
+                                       default=0.06, min=0.001, precision=4, step=1)
+    sizefactor : bpy.props.FloatProperty(name="Size Factor",
+                                         description="Multiplication Factor",
+                                         default=1.7, precision=4, step=1)
+    count : bpy.props.IntProperty(name="Count",
+                                  description="Number of Circles",
+                                  default=8)
+    segments : bpy.props.IntProperty(name="Cylinder Segments",
+                                     description="Number of Circle Segments",
+                                     default=32)
+    startheight : bpy.props.FloatProperty(name="Start Height",
+                                          description="Cylinder Start Height",
+                                          default=0.2, precision=4, step=1)
+    heightmode : bpy.props.EnumProperty(name="Height Mode",
+                                        description="Height Mode",
+                                        items=mode_options)
+    heightfactor : bpy.props.FloatProperty(name="Height Factor",
+                                           description="Cylinder Height Inc. Factor",
+                                           default=0.28, precision=4, step=1)
+    heightoption : bpy.props.EnumProperty(name="Height Option",
+                                          description="Height Option",
+                                          items=height_options)
+    angle : bpy.props.FloatProperty(name="Angle",
+                                    description="Angle is Calculated",
+                                    default=1.00000, precision=4)
+
+    def execute(self, context):
+        angle = math.asin(((self.startrad * self.sizefactor) - self.startrad) /
+                          ((self.startrad * self.sizefactor) + self.startrad))
+        self.angle = math.degrees(angle)
+        k = np.arange(self.count)
+        rad = self.startrad * np.power(self.sizefactor, k)
+        x = self.startrad / math.sin(angle) + np.concatenate(([0.0], np.cumsum(rad[:-1] + rad[1:])))[:self.count]
+        if self.heightmode == "MULTIPLICATION":
+            height = self.startheight * np.power(self.heightfactor, k)
+        else:
+            height = self.startheight + self.heightfactor * k
+        if self.heightoption == "CENTER":
+            z = np.zeros(self.count)
+        elif self.heightoption == "BOTTOM":
+            z = height / 2
+        else:
+            z = -height / 2
+        centers = np.stack((x, np.zeros(self.count), z), axis=-1)
+
+        if self.type == "MESH":
+            data = cylinders_mesh(bpy.data.meshes.new('KTX Cylinders'), centers,
+                                  rad, height, self.segments)
+            bpy.context.collection.objects.link(bpy.data.objects.new('KTX Cylinders', data))
+        else:
+            # extrude is per curve, so one curve object per cylinder, with the
+            # circle around its origin like primitive_bezier_circle_add
+            for center, r, h in zip(centers, rad, height):
+                data = circles_curve('KTX Cylinder', (0.0, 0.0, 0.0), r, h / 2.0)
+                obj = bpy.data.objects.new('KTX Cylinder', data)
+                obj.location = center
+                bpy.context.collection.objects.link(obj)
+        return {'FINISHED'}
+
+
+class KTXCylinderGrid(bpy.types.Operator):
+    bl_idname = "wm.ktx_cylinder_grid"
+    bl_description = "Add cylinder grid"
+    bl_label = "KTX Cylinder Grid"
+    bl_options = {'REGISTER', 'UNDO'}
+
+    def type_options(self,context):
+        return [("CURVE","Curve","Set Type to Curve"),("MESH","Mesh","Set Type to Mesh")]
+
+    type : bpy.props.EnumProperty(name="Mesh/Curve",
+                                  description="Mesh or Curve Mode",
+                                  items=type_options)
+    radius : bpy.props.FloatProperty(name="Radius",
+                                     description="Cylinder Radius",
+                                     default=0.01, min=0.001, precision=4, step=1)
+    radsup : bpy.props.FloatProperty(name="Radius Supplement",
+                                     description="Cylinder Radius Extra",
+                                     default=0.0, precision=4, step=0.01)
+    height : bpy.props.FloatProperty(name="Height",
+                                     description="Cylinder Height",
+                                     default=0.01, precision=4, step=1)
+    segments : bpy.props.IntProperty(name="Cylinder Segments",
+                                     description="Number of Circle Segments",
+                                     default=32)
+    countx : bpy.props.IntProperty(name="Count X",
+                                   description="Number of Cylinders on X-axis",
+                                   default=8)
+    county : bpy.props.IntProperty(name="Count Y",
+                                   description="Number of Cylinders on Y-axis",
+                                   default=8)
+
+    def execute(self, context):
+        v, u = np.divmod(np.arange(self.countx * self.county), self.countx)
+        centers = np.stack(((2 * u + v % 2) * self.radius,
+                            v * 2 * self.radius * math.sqrt(0.75),
+                            np.zeros(len(u))), axis=-1)
+        if self.type == "MESH":
+            data = cylinders_mesh(bpy.data.meshes.new('KTX Cylinder Grid'), centers,
+                                  self.radius + self.radsup, self.height, self.segments)
+        else:
+            data = circles_curve('KTX Cylinder Grid', centers,
+                                 self.radius + self.radsup, self.height/2.0)
+        bpy.context.collection.objects.link(bpy.data.objects.new('KTX Cylinder Grid', data))
+        return {'FINISHED'}
+
+
+class KTXObjectGrid(bpy.types.Operator):
+    bl_idname = "wm.ktx_object_grid"
+    bl_description = "Add object grid"
+    bl_label = "KTX Object Grid"
+    bl_options = {'REGISTER', 'UNDO'}
+
+    def type_options(self,context):
+        return [("TRI","Triangular","Set Array Type to Triangular"),
+            ("SQR","Square","Set Array Type to Square")]
+
+    type : bpy.props.EnumProperty(name="Type",
+                                  description="Triangular or Square",
+                                  items=type_options)
+    linkedcopy : bpy.props.BoolProperty(name="Linked Copies",
+                                        description="Make a Linked copy",
+                                        default=True)
+    output : bpy.props.EnumProperty(name="Output",
+                                    description="Separate objects or one instancing object",
+                                    items=COPY_OUTPUTS)
+    radius : bpy.props.FloatProperty(name="Distance",
+                                     description="Distance",
+                                     default=0.01, min=0.001, precision=4, step=0.1)
+    countx : bpy.props.IntProperty(name="Count X",
+                                   description="Number of Cylinders on X-axis",
+                                   default=8)
+    county : bpy.props.IntProperty(name="Count Y",
+                                   description="Number of Cylinders on Y-axis",
+                                   default=8)
+
+    def execute(self, context):
+        obj = bpy.context.active_object
+        if obj:
+            v, u = np.divmod(np.arange(1, self.countx * self.county), self.countx)
+            locations, rotations, scales = copy_transforms(obj, len(u))
+            if self.type == "TRI":
+                locations[:, 0] = (2 * u + v % 2) * self.radius
+                locations[:, 1] = v * 2 * self.radius * math.sqrt(0.75)
+            else:
+                locations[:, 0] = 2 * u * self.radius
+                locations[:, 1] = v * 2 * self.radius
+            locations[:, 2] = 0
+            add_output(obj, locations, rotations, scales, self.output,
+                       self.linkedcopy, self.report)
+        return {'FINISHED'}
+
+
+class KTXPolarArray(bpy.types.Operator):
+    bl_idname = "wm.ktx_polar_array"
+    bl_description = "Add polar array"
+    bl_label = "KTX Polar Array"
+    bl_options = {'REGISTER', 'UNDO'}
+
+    linkedcopy : bpy.props.BoolProperty(name="Linked Copies",
+                                        description="Make a Linked copy",
+                                        default=True)
+    startang : bpy.props.FloatProperty(name="Start Angle",
+                                       description="Start Angle",
+                                       default=0.0)
+    endang : bpy.props.FloatProperty(name="End Angle",
+                                     description="End Angle",
+                                     default=360.0)
+    count : bpy.props.IntProperty(name="Number of Items",
+                                  description="Number of Arrayed Items",
+                                  default=12, min=1)
+
+    def execute(self, context):
+        obj = bpy.context.active_object
+        if obj:
+            inc = (self.endang-self.startang) / self.count
+            angles = np.radians(-(self.startang + inc * np.arange(self.count)))
+            obj.rotation_euler[2] = angles[0]
+            locations, rotations, scales = copy_transforms(obj, self.count - 1)
+            rotations[:, 2] = angles[1:]
+            add_copies(obj, locations, rotations, scales, self.linkedcopy)
+        return {'FINISHED'}
+
+
+class KTXPolarArray2(bpy.types.Operator):
+    bl_idname = "wm.ktx_polar_array2"
+    bl_description = "Add polar array 2"
+    bl_label = "KTX Polar Array 2"
+    bl_options = {'REGISTER', 'UNDO'}
+
+    def type_options(self,context):
+        return [("FAC","Factor","Set Type Factor"),
+            ("STP","Step","Set Type to Factor")]
+
+    linkedcopy : bpy.props.BoolProperty(name="Linked Copies",
+                                        description="Make a Linked copy",
+                                        default=True)
+    angstep : bpy.props.FloatProperty(name="Angle Step",
+                                       description="Angle Step",
+                                       default=5.0)
+    scale_type : bpy.props.EnumProperty(name="Scale Type",
+                                        description="Factor or Step Mode",
+                                        items=type_options)
+    scale_factor : bpy.props.FloatProperty(name="Scale Factor",
+                                     description="Scale Factor",
+                                     default=0.95)
+    scale_step : bpy.props.FloatProperty(name="Scale Step",
+                                     description="Scale Step",
+                                     default=0.05)
+    distance_z : bpy.props.FloatProperty(name="Distance Z",
+                                  description="Z Distance of Arrayed Items",
+                                  default=0.1)
+    distance_y : bpy.props.FloatProperty(name="Distance Y",
+                                  description="Y Distance of Arrayed Items",
+                                  default=0.0)
+    distance_x : bpy.props.FloatProperty(name="Distance X",
+                                  description="X Distance of Arrayed Items",
+                                  default=0.0)
+    count : bpy.props.IntProperty(name="Number of Items",
+                                  description="Number of Arrayed Items",
+                                  default=8, min=1, max=200)
+
+    def draw(self, context):
+        layout = self.layout
+        col = layout.column()
+        col.prop(self, 'linkedcopy')
+        col.prop(self, 'angstep')
+        col.separator()
+        col.prop(self, 'scale_type')
+        if self.scale_type == "FAC":
+            col.prop(self, 'scale_factor')
+        else:
+            col.prop(self, 'scale_step')
+        col.prop(self, 'distance_x')
+        col.prop(self, 'distance_y')
+        col.prop(self, 'distance_z')
+        col.separator()
+        col.prop(self, 'count')
+
+    def execute(self, context):
+        obj = bpy.context.active_object
+        if obj:
+            k = np.arange(1, self.count)
+            locations, rotations, scales = copy_transforms(obj, len(k))
+            locations[:] = np.multiply.outer(k, (self.distance_x, self.distance_y, -self.distance_z))
+            rotations[:] = np.multiply.outer(k, (0, 0, math.radians(self.angstep)))
+            if self.scale_type == "FAC":
+                scale = np.power(self.scale_factor, k)
+            else:
+                scale = 1 - self.scale_step * k
+            scales[:] = np.stack((scale, scale, np.ones(len(k))), axis=-1)
+            add_copies(obj, locations, rotations, scales, self.linkedcopy)
+        return {'FINISHED'}
+
+
+# font file path -> (modification time, font datablock name)
+font_cache = {}
+
+
+def load_font(path):
+    # Font datablock for the font file at path, None when there is no such
+    # file. The datablock is remembered across executes and reloaded when
+    # the file has been modified since
+    path = bpy.path.abspath(path)
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    if not stat.S_ISREG(st.st_mode):
+        return None
+    entry = font_cache.get(path)
+    font = bpy.data.fonts.get(entry[1]) if entry else None
+    # after loading another .blend the name can belong to a different font
+    if font is not None and bpy.path.abspath(font.filepath) != path:
+        font = None
+    if font is None:
+        count = len(bpy.data.fonts)
+        font = bpy.data.fonts.load(path, check_existing=True)
+        # an already loaded datablock of the file may be older than the file
+        stale = len(bpy.data.fonts) == count
+    else:
+        stale = entry[0] != st.st_mtime
+    if stale:
+        font.reload()
+    font_cache[path] = (st.st_mtime, font.name)
+    return font
+
+
+def add_clock_numbers(context, coll, mtl, font, props):
+    # The twelve dial numbers as text objects in coll, around the 3D cursor.
+    # props holds the KTXClockNumbers settings (mins, radius, padding, ...).
+    # Returns (object, dial position) pairs for center_clock_numbers
+    if props.mins:
+        ob_pre = 'min_'
+        number = 5
+    else:
+        ob_pre = 'hour_'
+        number = 1
+    angle = 30
+    cursor = context.scene.cursor.location
+    placed = []
+    for dupli in range(0, 12):
+        obname = ob_pre + str(number).zfill(2)
+        newtxt = bpy.data.curves.new(obname, 'FONT')
+        newtxt.body = str(number).zfill(props.padding)
+        newtxt.size = props.scale_factor
+        newtxt.align_x = 'CENTER'
+        newtxt.align_y = 'CENTER'
+        if font:
+            newtxt.font = font
+        if (props.extrude):
+            newtxt.bevel_depth = props.depth/1000
+            newtxt.bevel_resolution = 0
+            newtxt.offset = props.offset/1000
+            newtxt.extrude = props.height/100
+        obj = bpy.data.objects.new(obname, newtxt)
+        coll.objects.link(obj)
+        obj.show_bounds = props.show_bounds
+        obj.active_material = mtl
+        if (props.rotate):
+            if (props.readable and angle > 90 and angle < 269):
+                obj.rotation_euler = (0, 0, math.radians(-angle+180))
+            else:
+                obj.rotation_euler = (0, 0, math.radians(-angle))
+        if (props.extrude):
+            obj.modifiers.new("EdgeSplit", type='EDGE_SPLIT')
+        placed.append((obj, Vector((cursor.x + props.radius * math.sin(math.radians(angle)),
+                                    cursor.y + props.radius * math.cos(math.radians(angle)),
+                                    cursor.z))))
+        if props.mins:
+            number += 5
+        else:
+            number += 1
+        angle += 30
+    return placed
+
+
+def center_clock_numbers(context, placed):
+    # center the glyphs on their position from the evaluated text bounds,
+    # one depsgraph evaluation for all numbers
+    depsgraph = context.evaluated_depsgraph_get()
+    for obj, location in placed:
+        bounds = obj.evaluated_get(depsgraph).bound_box
+        center = Vector([sum(axis) / 8 for axis in zip(*bounds)])
+        obj.location = location - obj.rotation_euler.to_matrix() @ center
+
+
+class KTXClockNumbersProps:
+    # Clock number settings shared by KTXClockNumbers and KTXWatchFace, the
+    # props that add_clock_numbers reads
+    show_bounds : bpy.props.BoolProperty(name="Show Bounds",
+                                         description="Show Font Bounds",
+                                         default=False)
+    mins : bpy.props.BoolProperty(name="Minutes",
+                                  description="Minutes",
+                                  default=False)
+    extrude : bpy.props.BoolProperty(name="Extrude",
+                                     description="Extrude",
+                                     default=False)
+    height : bpy.props.FloatProperty(name="Height",
+                                     description="Height",
+                                     default=1.0)
+    depth : bpy.props.FloatProperty(name="Depth",
+                                    description="Depth",
+                                    default=2.0)
+    offset : bpy.props.FloatProperty(name="Offset",
+                                     description="Offset",
+                                     default=-2.0)
+    scale_factor : bpy.props.FloatProperty(name="Scale Factor",
+                                           description="Scale Factor",
+                                           default=0.4)
+    radius : bpy.props.FloatProperty(name="Radius",
+                                     description="Radius",
+                                     default=0.8)
+    padding : bpy.props.IntProperty(name="Padding",
+                                    description="Padding",
+                                    default=1, min=1, max=10)
+    rotate : bpy.props.BoolProperty(name="Rotate",
+                                    description="Rotate",
+                                    default=False)
+    readable : bpy.props.BoolProperty(name="Readable",
+                                      description="Readable",
+                                      default=False)
+    font : bpy.props.StringProperty(name="Font",
+                                    description="Font",
+                                    default=bpy.context.preferences.filepaths.font_directory,
+                                    subtype='FILE_PATH')
+
+
+class KTXClockNumbers(KTXClockNumbersProps, bpy.types.Operator):
+    bl_idname = "wm.ktx_clocknumbers"
+    bl_description = "Add Clock Numbers"
+    bl_label = "KTX Clock Numbers"
+    bl_options = {'REGISTER', 'UNDO'}
+
+#    def origin_type_options(self, context):
+#        return [('GEOMETRY_ORIGIN','Geometry to Origin',"Set Geometry to Origin"),
+#                ('ORIGIN_GEOMETRY','Origin to Geometry',"Set Origin to Geometry"),
+#                ('ORIGIN_CURSOR','Origin to Cursor',"Set Origin to Cursor"),
+#                ('ORIGIN_CENTER_OF_MASS','Origin to Center of Mass',"Set Origin to Center of Mass"),
+#                ('ORIGIN_CENTER_OF_VOLUME','Origin to Center of Volume',"Set Origin tp Center of Volume")
+#                ]
+
+#    def origin_center_options(self, context):
+#        return [('MEDIAN','Median',"Select Center Median"),('BOUNDS','Bounds',"Select Center Bounds")]
+
+#    origin_type : bpy.props.EnumProperty(items=origin_type_options,
+#                                   description="Origin Type",
+#                                   name="Set Origin to this location")
+#    origin_center : bpy.props.EnumProperty(items=origin_center_options,
+#                                   description="Origin Center",
+#                                   name="Set Origin Center this location")
+#    center : bpy.props.BoolProperty(name="Center",
+#                                    description="Center",
+#                                    default=True)
+#    font : bpy.props.StringProperty(name="Font",
+#                                     description="Font Name",
+#                                     default="Bfont")
+
+    def draw(self, context):
+        layout = self.layout
+        col = layout.column()
+#        col.prop_search(self, "font", bpy.context.blend_data, "fonts")
+        col.prop(self, "mins")
+        col.prop(self, "font")
+        col.prop(self, "show_bounds")
+        col.separator()
+#        col.prop(self, "center")
+#        if (self.center):
+#            col.prop(self, "origin_type")
+#            col.prop(self, "origin_center")
+        col.separator()
+        col.prop(self, 'extrude')
+        if (self.extrude):
+            col.prop(self, 'height')
+            col.prop(self, 'offset')
+            col.prop(self, 'depth')
+            col.separator()
+        col.prop(self, 'scale_factor')
+        col.prop(self, 'radius')
+        col.prop(self, 'padding')
+        col.separator()
+        col.prop(self, 'rotate')
+        if (self.rotate):
+            col.prop(self, 'readable')
+
+    def execute(self, context):
+        mtl = bpy.data.materials.new("NumbersMat")
+        mtl.use_nodes = True
+        if self.mins:
+            coll = bpy.data.collections.new('MinuteNumbers')
+        else:
+            coll = bpy.data.collections.new('HourNumbers')
+        bpy.context.scene.collection.children.link(coll)
+        placed = add_clock_numbers(context, coll, mtl, load_font(self.font), self)
+        center_clock_numbers(context, placed)
+        return {'FINISHED'}
+
+
+def tick_mask(count, skip, skipa):
+    # Which of count dial ticks to keep. With skip, ticks within skipa ticks
+    # of an hour position are left out. Integer math: tick k lies
+    # ((12 * k) % count) / 12 ticks past the previous hour
+    r = (12 * np.arange(count)) % count
+    if not skip:
+        return np.ones(count, dtype=bool)
+    return np.minimum(r, count - r) > 12 * skipa
+
+
+def tick_ring_mesh(mesh, radius, count, mask):
+    # All kept ticks of the dial in one mesh, the tick quad rotated per tick
+    template = np.array(((-0.01, radius, 0.0), (0.01, radius, 0.0),
+                         (-0.01, radius - 0.1, 0.0), (0.01, radius - 0.1, 0.0)))
+    angle = -np.radians(np.arange(count)[mask] * (360 / count))
+    c, s = np.cos(angle)[:, None], np.sin(angle)[:, None]
+    verts = np.stack((c * template[:, 0] - s * template[:, 1],
+                      s * template[:, 0] + c * template[:, 1],
+                      np.zeros((len(angle), 4))), axis=-1)
+    faces = np.array((0, 1, 3, 2)) + 4 * np.arange(len(angle))[:, None]
+    return mesh_from_arrays(mesh, verts, faces=faces)
+
+
+class KTXClockTicks(bpy.types.Operator):
+    bl_idname = "wm.ktx_clockticks"
+    bl_description = "Add Clock Ticks"
+    bl_label = "KTX Clock Ticks"
+    bl_options = {'REGISTER', 'UNDO'}
+
+    radius : bpy.props.FloatProperty(name="Radius",
+                                  description="Radius",
+                                  default=1.0, min=0)
+    count : bpy.props.IntProperty(name="Number of Items",
+                                  description="Number of Arrayed Items",
+                                  default=60, min=1)
+    skip : bpy.props.BoolProperty(name="Skip",
+                                description="Skip At Number Positions",
+                                default=0)
+    skipa : bpy.props.IntProperty(name="Skip Amount",
+                                description="Skip Amount",
+                                default=0)
+    merge : bpy.props.BoolProperty(name="Single Object",
+                                   description="Put all ticks in one mesh object",
+                                   default=True)
+
+    def draw(self, context):
+        layout = self.layout
+        col = layout.column()
+        col.prop(self, "radius")
+        col.prop(self, "count")
+        col.prop(self, "merge")
+        col.prop(self, "skip")
+        if (self.skip):
+            col.prop(self, 'skipa')
+
+    def execute(self, context):
+        mtl = bpy.data.materials.new("TicksMat")
+        mtl.use_nodes = True
+
+        coll = bpy.data.collections.new("ClockTicks")
+        bpy.context.scene.collection.children.link(coll)
+        bpy.context.view_layer.active_layer_collection = bpy.context.view_layer.layer_collection.children[coll.name]
+
+        keep = tick_mask(self.count, self.skip, self.skipa)
+
+        if self.merge:
+            mesh = tick_ring_mesh(bpy.data.meshes.new("Ticks"), self.radius, self.count, keep)
+            obj = bpy.data.objects.new("Ticks", mesh)
+            coll.objects.link(obj)
+            obj.active_material = mtl
+            obj.location = context.scene.cursor.location
+            return {'FINISHED'}
+
+        verts = [(-0.01,self.radius,0.0),(0.01,self.radius,0.0),(-0.01,self.radius-0.1,0.0),(0.01,self.radius-0.1,0.0)]
+        faces = [(0,1,3,2)]
+
+        mesh=bpy.data.meshes.new("Tick")
+        mesh_from_arrays(mesh, verts, faces=faces)
+
+        inc = 360 / self.count
+        for copies in np.flatnonzero(keep).tolist():
+            obj = bpy.data.objects.new("Tick",mesh)
+            coll.objects.link(obj)
+            obj.active_material = mtl
+            obj.location = context.scene.cursor.location
+            obj.rotation_euler[2] = math.radians(-copies * inc)
+
+        return {'FINISHED'}
+
+
+class KTXPolarArray_old(bpy.types.Operator):
+    bl_idname = "wm.ktx_polar_array_old"
+    bl_description = "Add polar array (old)"
+    bl_label = "KTX Polar Array Old"
+    bl_options = {'REGISTER', 'UNDO'}
+
+    linkedcopy : bpy.props.BoolProperty(name="Linked Copies",
+                                        description="Make a Linked copy",
+                                        default=False)
+    startang : bpy.props.FloatProperty(name="Start Angle",
+                                       description="Start Angle",
+                                       default=0.0)
+    endang : bpy.props.FloatProperty(name="End Angle",
+                                     description="End Angle",
+                                     default=360.0)
+    count : bpy.props.IntProperty(name="Number of Items",
+                                  description="Number of Arrayed Items",
+                                  default=8)
+
+    def execute(self, context):
+        inc = (360 / self.count)
+        obj = bpy.context.active_object
+        if obj:
+            angles = math.radians(self.startang) + inc * np.arange(
+                max(int(math.floor((self.endang - math.radians(self.startang)) / inc + 1e-9)) + 1, 0))
+            locations, rotations, scales = copy_transforms(obj, len(angles))
+            locations[:] = np.stack((np.sin(np.radians(angles)), np.cos(np.radians(angles)),
+                                     np.zeros(len(angles))), axis=-1)
+            rotations[:] = np.stack((np.zeros(len(angles)), np.zeros(len(angles)),
+                                     np.radians(-angles)), axis=-1)
+            add_copies(obj, locations, rotations, scales, self.linkedcopy)
+        return {'FINISHED'}
+
+
+class KTXSPIRALCIRCLES_OT_Execute(KTXPolylineOutputProps, bpy.types.Operator):
+    bl_idname = "ktxspiralcircles.execute"
+    bl_description = "Add circles on a spiral"
+    bl_label = "KTX Circles on a spiral"
+    bl_options = {'REGISTER', 'UNDO'}
+
+    def ctype_options(self, context):
+        return [("MESH","Mesh","Mesh Mode"),("CURVE","Curve","Curve Mode")]
+
+    cadd : bpy.props.BoolProperty(name="Add Circles",
+                                  description="Add Circles to Spiral",
+                                  default=False)
+    ctype : bpy.props.EnumProperty(name="Mesh/Curve",
+                                   description="Choose between Mesh or Curve",
+                                   items=ctype_options)
+    startrad : bpy.props.FloatProperty(name="Start Radius",
+                                       description="Start Radius",
+                                       default=1.0,precision=4, step=1)
+    rincrement : bpy.props.FloatProperty(name="Radius Increment",
+                                         description="Radius Increment",
+                                         default=0.1,precision=4, step=1)
+    startang : bpy.props.FloatProperty(name="Start Angle",
+                                       description="Start Angle",
+                                       default=0.0)
+    endang : bpy.props.FloatProperty(name="End Angle",
+                                     description="End Angle",
+                                     default=360.0)
+    increment : bpy.props.FloatProperty(name="Angle Increment",
+                                        description="Angle Increment",
+                                        default=10.0)
+    zincrement : bpy.props.FloatProperty(name="Z Increment",
+                                         description="Z Increment",
+                                         default=0.0,precision=4, step=1)
+    height : bpy.props.FloatProperty(name="Circle Height",
+                                     description="Curve Circle Extrude Height",
+                                     default=0.1,precision=4, step=1)
+    csegments : bpy.props.IntProperty(name="Circle Segments",
+                                      description="Circle Segments",
+                                      default=16)
+    scale : bpy.props.FloatProperty(name="Scale Circles",
+                                     description="Scale circles",
+                                     default=1.0,precision=4, step=1)
+    cbatch : bpy.props.BoolProperty(name="Single Object",
+                                    description="Put all circles in one mesh or curve object",
+                                    default=True)
+
+    def twopcircle(self, point_1, point_2):
+        origin_x = (point_1[0] + point_2[0]) / 2.0
+        origin_y = (point_1[1] + point_2[1]) / 2.0
+        a = math.pow((point_2[0] - point_1[0]), 2)
+        b = math.pow((point_2[1] - point_1[1]), 2)
+        radius = math.sqrt(a + b) / 2.0
+        return(origin_x, origin_y, radius)
+
+    def circles(self, centers, radii, segments):
+        # ring vertices and edges of all circles, one block of segments per circle
+        angle = np.arange(segments) * (2 * math.pi / segments)
+        ring = np.stack((np.cos(angle), np.sin(angle), np.zeros(segments)), axis=-1)
+        verts = ring * np.asarray(radii)[:, None, None] + np.asarray(centers)[:, None, :]
+        edges = polyline_edges(segments, True) + segments * np.arange(len(centers))[:, None, None]
+        return verts.reshape(-1, 3), edges.reshape(-1, 2)
+
+    def draw(self, context):
+        layout = self.layout
+        col = layout.column()
+        col.prop(self,"startrad")
+        col.prop(self,"rincrement")
+        col.prop(self,"startang")
+        col.prop(self,"endang")
+        col.prop(self,"increment")
+        col.prop(self,"zincrement")
+        self.draw_polyline(col)
+        col.separator()
+        col.prop(self,"cadd")
+        if (self.cadd):
+            col.prop(self,"ctype")
+            col.prop(self,"cbatch")
+            col.prop(self,"height")
+            col.prop(self,"scale")
+            if (self.ctype == "MESH"):
+                col.prop(self,"csegments")
+
+
+    def execute(self, context):
+        if self.increment <= 0:
+            self.report({'ERROR'}, "Angle Increment must be positive")
+            return {'CANCELLED'}
+        i = np.arange(int(math.floor((self.endang - self.startang) / self.increment + 1e-9)) + 1)
+        angle = np.radians(self.startang + i * self.increment)
+        r = self.startrad + i * self.rincrement
+        verts = np.stack((np.cos(angle) * r, np.sin(angle) * r,
+                          (i + 1) * self.zincrement), axis=-1)
+
+        if self.cadd and self.cbatch and len(verts) > 1:
+            # twopcircle for all consecutive spiral points at once
+            centers = (verts[:-1] + verts[1:]) / 2
+            centers[:, 2] = verts[1:, 2]
+            radii = np.linalg.norm(verts[1:, :2] - verts[:-1, :2], axis=1) / 2 * self.scale
+            if self.ctype == "CURVE":
+                # a filled curve has to be 2D, so one curve object per circle
+                # height, placed at that height
+                for z in np.unique(centers[:, 2]).tolist():
+                    level = centers[:, 2] == z
+                    data = circles_curve('KTX Spiral Circles', centers[level] * (1, 1, 0),
+                                         radii[level], self.height/2)
+                    obj = bpy.data.objects.new('KTX Spiral Circles', data)
+                    obj.location.z = z
+                    bpy.context.scene.collection.objects.link(obj)
+            else:
+                if self.height > 0:
+                    data = cylinders_mesh(bpy.data.meshes.new('KTX Spiral Circles'),
+                                          centers, radii, self.height, self.csegments)
+                else:
+                    ring_verts, ring_edges = self.circles(centers, radii, self.csegments)
+                    data = mesh_from_arrays(bpy.data.meshes.new('KTX Spiral Circles'),
+                                            ring_verts, edges=ring_edges)
+                bpy.context.scene.collection.objects.link(bpy.data.objects.new('KTX Spiral Circles', data))
+        elif self.cadd:
+            for p1, p2 in zip(verts[:-1].tolist(), verts[1:].tolist()):
+                circ = self.twopcircle(p1, p2)
+                z = p2[2]
+                if self.ctype == "CURVE":
+                    bpy.ops.curve.primitive_bezier_circle_add(
+                        radius=circ[2]*self.scale, location=(circ[0], circ[1], z))
+                    obj1 = bpy.context.active_object
+                    obj1.data.extrude = self.height/2
+                    obj1.data.dimensions = '2D'
+                    obj1.data.fill_mode = 'BOTH'
+                else:
+                    bpy.ops.mesh.primitive_cylinder_add(
+                        vertices=self.csegments, radius=circ[2]*self.scale, depth=self.height, location=(circ[0], circ[1], z))
+
+        verts = simplify_polyline(verts, self.simplify)
+        data = polyline_data('KTX Spiral', verts, self.output,
+                             bevel_depth=self.bevel_depth, extrude=self.extrude)
+        obj = bpy.data.objects.new('KTX Spiral', data)
+        bpy.context.scene.collection.objects.link(obj)
+        return {'FINISHED'}
+
+
+POLISH_QUALITY = (('PREVIEW', "Preview", "Run on a decimated proxy copy of the object"),
+                  ('FULL', "Full", "Run on the object at full resolution"))
+
+# (stage, seconds, vertices) of the last polish run, shown in the panel
+polish_stats = []
+
+
+def polish_proxy(context, source, ratio):
+    # Decimated copy of source to run the pipeline on, source gets hidden
+    proxy = source.copy()
+    proxy.data = source.data.copy()
+    proxy.name = source.name + "_preview"
+    proxy['ktx_polish_source'] = source.name
+    for coll in source.users_collection:
+        coll.objects.link(proxy)
+    mod = proxy.modifiers.new("Preview", type='DECIMATE')
+    mod.ratio = ratio
+    mod.use_collapse_triangulate = True
+    source.select_set(False)
+    source.hide_set(True)
+    proxy.select_set(True)
+    context.view_layer.objects.active = proxy
+    # new modifiers go to the end, the decimation has to come before the
+    # copied modifier stack
+    bpy.ops.object.modifier_move_to_index(modifier="Preview", index=0)
+    bpy.ops.object.modifier_apply(modifier="Preview")
+    return proxy
+
+
+def apply_modifier(obj, name, type, **settings):
+    mod = obj.modifiers.new(name, type=type)
+    for key, value in settings.items():
+        setattr(mod, key, value)
+    bpy.ops.object.modifier_apply(modifier=mod.name)
+
+
+class KTXPolish(bpy.types.Operator):
+    bl_idname = "wm.ktx_polish"
+    bl_description = "Polish mesh"
+    bl_label = "Polish"
+    bl_options = {'REGISTER', 'UNDO'}
+
+    quality : bpy.props.EnumProperty(name="Quality",
+                                     description="Tune on a decimated proxy or polish the full mesh",
+                                     items=POLISH_QUALITY, default='FULL')
+    preview_ratio : bpy.props.FloatProperty(name="Preview Ratio",
+                                            description="Decimate Ratio of the preview proxy",
+                                            default=0.25, min=0.001, max=1.0)
+    ratio : bpy.props.FloatProperty(name="Decimate Ratio",
+                                    description="Decimate Ratio",
+                                    default=0.03, min=0.0, max=1.0)
+    segments : bpy.props.IntProperty(name="Bevel Segments",
+                                     description="Bevel Segments",
+                                     default=2, min=1, soft_max=10)
+    level : bpy.props.IntProperty(name="Subdivision Level",
+                                  description="Subdivision Level",
+                                  default=2, min=0, max=6)
+
+    def prepare(self, obj):
+        # drop the subdivision modifiers, the subdivision stage adds its own,
+        # and bake the remaining modifier stack of obj only
+        for mod in [mod for mod in obj.modifiers if mod.type == 'SUBSURF']:
+            obj.modifiers.remove(mod)
+        for ob in bpy.context.selected_objects:
+            ob.select_set(False)
+        obj.select_set(True)
+        bpy.context.view_layer.objects.active = obj
+        bpy.ops.object.convert(target='MESH')
+
+    def decimate(self, obj):
+        apply_modifier(obj, "Decimate", 'DECIMATE', ratio=self.ratio,
+                       use_collapse_triangulate=True)
+
+    def bevel(self, obj):
+        apply_modifier(obj, "Bevel", 'BEVEL', segments=self.segments, profile=1,
+                       limit_method='ANGLE')
+
+    def subdivide(self, obj):
+        if self.level:
+            apply_modifier(obj, "Subdivision", 'SUBSURF', levels=self.level)
+
+    def smooth(self, obj):
+        obj.data.polygons.foreach_set("use_smooth", np.ones(len(obj.data.polygons), dtype=bool))
+        obj.data.update()
+
+    def dyntopo(self, obj):
+        bpy.ops.object.mode_set(mode='SCULPT')
+        if not obj.use_dynamic_topology_sculpting:
+            bpy.ops.sculpt.dynamic_topology_toggle()
+
+    def symmetrize(self, obj):
+        bpy.ops.sculpt.symmetrize()
+
+    def execute(self, context):
+        obj = context.object
+        if obj is None or obj.type != 'MESH':
+            self.report({'ERROR'}, "Polish needs an active mesh object")
+            return {'CANCELLED'}
+        bpy.ops.object.mode_set(mode='OBJECT')
+
+        # a preview proxy is replaced by a fresh one, or by its source at full quality
+        source = bpy.data.objects.get(obj.get('ktx_polish_source', ""))
+        if source is not None:
+            mesh = obj.data
+            bpy.data.objects.remove(obj)
+            bpy.data.meshes.remove(mesh)
+            source.hide_set(False)
+            source.select_set(True)
+            context.view_layer.objects.active = source
+            obj = source
+        if self.quality == 'PREVIEW':
+            obj = polish_proxy(context, obj, self.preview_ratio)
+
+        stages = (("Prepare", self.prepare),
+                  ("Decimate", self.decimate),
+                  ("Bevel", self.bevel),
+                  ("Subdivision", self.subdivide),
+                  ("Shade Smooth", self.smooth),
+                  ("Dyntopo", self.dyntopo),
+                  ("Symmetrize", self.symmetrize))
+        polish_stats.clear()
+        for name, stage in stages:
+            start = time.perf_counter()
+            stage(obj)
+            seconds = time.perf_counter() - start
+            # in sculpt mode the mesh data lags behind the dyntopo bmesh
+            verts = len(obj.data.vertices)
+            polish_stats.append((name, seconds, verts))
+            self.report({'INFO'}, "Polish %s: %.2fs, %d vertices" % (name, seconds, verts))
+        return {'FINISHED'}
+
+
+@functools.lru_cache(maxsize=8)
+def tritangle_geometry(angletype, vx, vy, r):
+    # Base geometry of the ordered tangle triangle: vertex coordinates,
+    # (loops, totals) of the faces, the vertex pairs of the beam edges that
+    # get a bevel weight and the saw length. Kept in an LRU cache, so redo
+    # with changed modifier settings doesn't rebuild it
+    from math import radians
+    alpha = math.radians(90) - math.acos(1 / 3)
+    a = (vy / 100) / 2.0
+    b = a * math.tan(alpha)
+    c = a / math.cos(alpha)
+    d = b + c
+    e = (vx / 100) / math.cos(math.radians(30))
+    h = d + e
+    f = math.sqrt(3) * h
+    g = f
+    h = d + e
+    i1 = 2 * g * math.sqrt(3)
+    i2 = i1 - e
+
+    vx1 = (vx / 100) - (2 * r) / 100 + \
+        (2 * r * math.sin(radians(45))) / 100
+
+    factorx = i1 / (vx / 100)
+    i1x = factorx * vx1
+    i2x = i1x - e
+
+    g1 = math.tan(radians(30)) * 0.5 * i1x
+    sharpdist = (vx / 100) / math.tan(radians(30))
+
+    if angletype:
+        _a1x = g1 - (vx / 100)
+        _a1y = (0.5 * i1x) - sharpdist
+        _b1x = g1
+        _b1y = (0.5 * i1x)
+        _c1x = g1
+        _c1y = (-0.5 * i1x)
+        _d1x = g1 - (vx / 100)
+        _d1y = (-0.5 * i1x) + sharpdist
+        _z = (vy / 200)
+        sl = i1x * 100
+    else:
+        _a1x = g1 - (vx / 100)
+        _a1y = (0.5 * i1x) - sharpdist
+        _b1x = g1
+        _b1y = (0.5 * i1x) - e
+        _c1x = g1
+        _c1y = (-0.5 * i1x)
+        _d1x = g1 - (vx / 100)
+        _d1y = (-0.5 * i1x) + sharpdist - e
+        _z = (vy / 200)
+        sl = i2x * 100
+
+    verts = [(_a1x, _a1y, _z), (_b1x, _b1y, _z), (_c1x, _c1y, _z), (_d1x, _d1y, _z),
+             (_a1x, _a1y, -_z), (_b1x, _b1y, -_z), (_c1x, _c1y, -_z), (_d1x, _d1y, -_z)]
+    faces = [(0, 3, 2, 1), (1, 2, 6, 5), (5, 6, 7, 4),
+             (3, 0, 4, 7), (2, 3, 7, 6), (0, 1, 5, 4)]
+
+    bm = bmesh.new()
+    for vert in verts:
+        bm.verts.new(vert)
+
+    bm.verts.ensure_lookup_table()
+    bm.faces.ensure_lookup_table()
+
+    for face_vert in faces:
+        bm.faces.new([bm.verts[face_vert[0]], bm.verts[face_vert[1]], bm.verts[face_vert[2]], bm.verts[face_vert[3]]])
+
+    bm.edges.ensure_lookup_table()
+    bm.edges[1].seam = True
+    bm.edges[3].seam = True
+    bm.edges[6].seam = True
+    bm.edges[9].seam = True
+
+    # duplicate one beam twice and form a base triangle
+    ret = bmesh.ops.duplicate(bm, geom=bm.verts[:]+bm.edges[:]+bm.faces[:])
+    geom_dup = ret['geom']
+    verts_dup = [ele for ele in geom_dup if isinstance(ele, bmesh.types.BMVert)]
+    bmesh.ops.rotate(bm, verts=verts_dup, cent=(0,0,0), matrix=mathutils.Matrix.Rotation(math.radians(120.0), 3, 'Z'))
+
+    ret = bmesh.ops.duplicate(bm, geom=geom_dup)
+    verts_dup = [ele for ele in geom_dup if isinstance(ele, bmesh.types.BMVert)]
+    bmesh.ops.rotate(bm, verts=verts_dup, cent=(0,0,0), matrix=mathutils.Matrix.Rotation(math.radians(120.0), 3, 'Z'))
+
+    #duplicate triangle and rotate it trice
+    ret = bmesh.ops.duplicate(bm, geom=bm.verts[:]+bm.edges[:]+bm.faces[:])
+    geom_dup = ret['geom']
+    verts_dup = [ele for ele in geom_dup if isinstance(ele, bmesh.types.BMVert)]
+    bmesh.ops.rotate(bm, verts=verts_dup, cent=(0,0,0), matrix=mathutils.Matrix.Rotation(math.radians(180.0), 3, 'Z'))
+    bmesh.ops.rotate(bm, verts=verts_dup, cent=(0,0,0), matrix=mathutils.Matrix.Rotation(math.radians(70.5287793655), 3, 'X'))
+
+    ret = bmesh.ops.duplicate(bm, geom=geom_dup)
+    verts_dup = [ele for ele in geom_dup if isinstance(ele, bmesh.types.BMVert)]
+    bmesh.ops.rotate(bm, verts=verts_dup, cent=(0,0,0), matrix=mathutils.Matrix.Rotation(math.radians(120.0), 3, 'Z'))
+
+    ret = bmesh.ops.duplicate(bm, geom=geom_dup)
+    verts_dup = [ele for ele in geom_dup if isinstance(ele, bmesh.types.BMVert)]
+    bmesh.ops.rotate(bm, verts=verts_dup, cent=(0,0,0), matrix=mathutils.Matrix.Rotation(math.radians(120.0), 3, 'Z'))
+
+    bm.verts.index_update()
+    verts = np.array([v.co[:] for v in bm.verts])
+    loops = np.array([v.index for f in bm.faces for v in f.verts])
+    totals = np.array([len(f.verts) for f in bm.faces])
+    seams = np.sort(np.array([[v.index for v in e.verts] for e in bm.edges if e.seam]), axis=1)
+    bm.free()
+    for a in (verts, loops, totals, seams):
+        a.flags.writeable = False
+    return verts, (loops, totals), seams, sl
+
+
+class KTXTRITANGLE_OT_Execute(bpy.types.Operator):
+    bl_idname = "ktxtritangle.execute"
+    bl_description = "Create ordered tangle triangle"
+    bl_label = "Create Ordered Tangle Triangle"
+    bl_options = {'REGISTER', 'UNDO'}
+
+    angletype : bpy.props.BoolProperty(name="Sharp Corner Angle",
+                                       description="Sharp (60) or NonSharp (30) Corner Angle",
+                                       default=False)
+
+    vx : bpy.props.FloatProperty(name="Size X (mm)",
+                                 description="Length of Side",
+                                 default=44)
+    vy : bpy.props.FloatProperty(name="Size Y (mm)",
+                                 description="Height of Side",
+                                 default=44)
+    r : bpy.props.FloatProperty(name="Corner Radius",
+                                description="Corner Radius (mm)",
+                                default=4, min=0.0)
+
+    bevel : bpy.props.BoolProperty(name="Bevel Corners",
+                                   description="Bevel Corners",
+                                   default=True)
+    bevelr : bpy.props.FloatProperty(name="Bevel Radius",
+                                     description="Bevel Radius",
+                                     default=8.45, min=0.0)
+    beveltype : bpy.props.BoolProperty(name="Only Long Edges",
+                                       description="Bevel only the long edges",
+                                       default=True)
+
+    smooth : bpy.props.BoolProperty(name="Smooth",
+                                    description="Smooth Surfaces",
+                                    default=True)
+    edgesplit : bpy.props.BoolProperty(name="Edge Split",
+                                       description="Edge Split",
+                                       default=False)
+
+    sl : bpy.props.FloatProperty(name="Saw Length (mm)",
+                                 description="Saw Length",
+                                 default=0.0)
+
+    def execute(self, context):
+        verts, faces, seams, self.sl = tritangle_geometry(self.angletype, self.vx, self.vy, self.r)
+
+        me = bpy.data.meshes.new('KTX_TriTangle')
+        mesh_from_arrays(me, verts, faces=faces)
+        ob = bpy.data.objects.new('KTX_TriTangle', me)
+        bpy.context.scene.collection.objects.link(ob)
+        ob.select_set(True)
+
+        # bevel weight on the beam edges, matched by their vertex pairs
+        edges = np.empty(len(me.edges) * 2, dtype=np.int32)
+        me.edges.foreach_get("vertices", edges)
+        edges = np.sort(edges.reshape(-1, 2), axis=1)
+        n = len(verts)
+        weights = np.isin(edges[:, 0] * n + edges[:, 1], seams[:, 0] * n + seams[:, 1])
+        me.use_customdata_edge_bevel = True
+        me.edges.foreach_set("bevel_weight", weights.astype(np.float32))
+        if self.smooth:
+            me.polygons.foreach_set("use_smooth", np.ones(len(me.polygons), dtype=bool))
+            me.use_auto_smooth = True
+        if self.bevel:
+            ob.modifiers.new("Bevel", type='BEVEL')
+            ob.modifiers["Bevel"].offset_type = 'WIDTH'
+            ob.modifiers["Bevel"].segments = 10
+            ob.modifiers["Bevel"].width = self.bevelr / 100
+            if self.beveltype:
+                ob.modifiers["Bevel"].limit_method = 'WEIGHT'
+        if self.edgesplit:
+            ob.modifiers.new("EdgeSplit", type='EDGE_SPLIT')
+            ob.modifiers['EdgeSplit'].split_angle = 3.14159
+
+        return {'FINISHED'}
+
+
+SPIRO_VARIABLES = ('a', 'f1', 'f2', 'f3', 'f4', 'f5', 'f6')
+
+
+class KTXSpiroGraph2(KTXPolylineOutputProps, KTXAutoPeriodProps, bpy.types.Operator):
+    bl_idname = "wm.ktx_spirograph_2"
+    bl_description = "Create a spirograph curve"
+    bl_label = "KTX Make a Spirograph 2"
+    bl_options = {'REGISTER', 'UNDO', 'PRESET'}
+
+    fact1 : bpy.props.FloatProperty(name="Factor 1",
+                                    description="Factor 1",
+                                    default=5.0)
+    fact2 : bpy.props.FloatProperty(name="Factor 2",
+                                    description="Factor 2",
+                                    default=28.0)
+    fact3 : bpy.props.FloatProperty(name="Factor 3",
+                                    description="Factor 3",
+                                    default=7.0)
+    fact4 : bpy.props.FloatProperty(name="Factor 4",
+                                    description="Factor 4",
+                                    default=8.0)
+    fact5 : bpy.props.FloatProperty(name="Factor 5",
+                                    description="Factor 5",
+                                    default=0.0)
+    fact6 : bpy.props.FloatProperty(name="Factor 6",
+                                    description="Factor 6",
+                                    default=12.0)
+
+    functx : bpy.props.StringProperty(name="Function x",
+                                      description="Function x",
+                                      default="f1*math.cos(f2*a)+f3*math.sin(f4*a)+f5*math.cos(f6*a)")
+    functy : bpy.props.StringProperty(name="Function y",
+                                      description="Function y",
+                                      default="f1*math.sin(f2*a)+f3*math.cos(f4*a)+f5*math.sin(f6*a)")
+    functz : bpy.props.StringProperty(name="Function z",
+                                      description="Function z",
+                                      default="f5*math.sin(f6*a)")
+
+    endangle : bpy.props.IntProperty(name="Angle",
+                                     description="Angle",
+                                     default=3600)
+    increment : bpy.props.FloatProperty(name="Angle Increment",
+                                        description="Angle Increment",
+                                        default=1.0)
+
+    def draw(self, context):
+        layout = self.layout
+        col = layout.column()
+        for prop in ("fact1", "fact2", "fact3", "fact4", "fact5", "fact6",
+                     "functx", "functy", "functz"):
+            col.prop(self, prop)
+        col.prop(self, "endangle")
+        col.prop(self, "auto_period")
+        if (self.auto_period):
+            col.prop(self, "seglength")
+        else:
+            col.prop(self, "increment")
+        self.draw_polyline(col)
+
+    def execute(self, context):
+        try:
+            codex = compile_expression(self.functx, SPIRO_VARIABLES)
+            codey = compile_expression(self.functy, SPIRO_VARIABLES)
+            codez = compile_expression(self.functz, SPIRO_VARIABLES)
+        except ValueError as err:
+            self.report({'ERROR'}, str(err))
+            return {'CANCELLED'}
+
+        factors = {'f1': self.fact1 / 10, 'f2': self.fact2 / 10, 'f3': self.fact3 / 10,
+                   'f4': self.fact4 / 10, 'f5': self.fact5 / 10, 'f6': self.fact6 / 10}
+
+        def points(a):
+            return np.stack((evaluate_curve(codex, a, **factors),
+                             evaluate_curve(codey, a, **factors),
+                             evaluate_curve(codez, a, **factors)), axis=-1)
+
+        # terms are cos(f * a) = cos(2pi * f * a / 2pi), so the period in a
+        # is 2pi times the common period of the factors
+        frequencies = [f for amplitude, f in
+                       ((factors['f1'], factors['f2']), (factors['f3'], factors['f4']),
+                        (factors['f5'], factors['f6'])) if amplitude]
+        period = common_period(frequencies) if self.auto_period else None
+        # without a period (Auto Period off, or all terms zero) the angle
+        # range is sampled by increment
+        if not period and self.increment <= 0:
+            self.report({'ERROR'}, "Angle Increment must be positive")
+            return {'CANCELLED'}
+        try:
+            if period:
+                cycles = period * max(abs(f) for f in frequencies)
+                a = sample_period(points, 2 * math.pi * period, cycles, self.seglength)
+                self.endangle = int(round(360 * period))
+            else:
+                count = int(math.floor(self.endangle / self.increment + 1e-9)) + 1
+                a = np.radians(np.arange(count) * self.increment)
+            verts = simplify_polyline(points(a), self.simplify, period is not None)
+        except ValueError as err:
+            self.report({'ERROR'}, str(err))
+            return {'CANCELLED'}
+
+        data = polyline_data('KTX Spiral', verts, self.output, period is not None,
+                             self.bevel_depth, self.extrude)
+        obj = bpy.data.objects.new('KTX Spiral', data)
+        bpy.data.scenes[0].collection.objects.link(obj)
+        return {'FINISHED'}
+
+
+def setup_watch_cam(scn):
+    # Square orthographic render looking down on the dial, False when the
+    # scene has no camera
+    if not scn.camera:
+        return False
+    cam = scn.camera.name
+    scn.render.resolution_x = 360
+    scn.render.resolution_y = 360
+    scn.render.resolution_percentage = 100
+    bpy.data.cameras[cam].type='ORTHO'
+    bpy.data.cameras[cam].ortho_scale=2.0
+    bpy.data.cameras[cam].dof.focus_distance=2.0
+
+    bpy.data.objects[cam].location=((0,0,2))
+    bpy.data.objects[cam].rotation_euler=((0,0,0))
+    bpy.data.objects[cam].lock_location=((True,True,True))
+    bpy.data.objects[cam].lock_rotation=((True,True,True))
+    bpy.data.objects[cam].lock_scale=((True,True,True))
+    return True
+
+
+class KTXSetupWatchCam(bpy.types.Operator):
+    bl_idname = "wm.ktx_setup_watchcam"
+    bl_description = "Set Current Camera to Watch Face Design Mode"
+    bl_label = "KTX Watch Cam"
+    bl_options = {'REGISTER', 'UNDO'}
+
+    def execute(self, context):
+        if not setup_watch_cam(context.scene):
+            self.report({'ERROR'}, "The scene has no camera")
+            return {'CANCELLED'}
+        return {'FINISHED'}
+
+
+class KTXWatchFace(KTXClockNumbersProps, bpy.types.Operator):
+    bl_idname = "wm.ktx_watchface"
+    bl_description = "Add Clock Numbers, Ticks and Watch Cam in one go"
+    bl_label = "KTX Watch Face"
+    bl_options = {'REGISTER', 'UNDO'}
+
+    numbers : bpy.props.BoolProperty(name="Numbers",
+                                     description="Add Clock Numbers",
+                                     default=True)
+
+    ticks : bpy.props.BoolProperty(name="Ticks",
+                                   description="Add Clock Ticks",
+                                   default=True)
+    tick_radius : bpy.props.FloatProperty(name="Tick Radius",
+                                          description="Radius",
+                                          default=1.0, min=0)
+    tick_count : bpy.props.IntProperty(name="Number of Ticks",
+                                       description="Number of Ticks",
+                                       default=60, min=1)
+    skip : bpy.props.BoolProperty(name="Skip",
+                                  description="Skip At Number Positions",
+                                  default=True)
+    skipa : bpy.props.IntProperty(name="Skip Amount",
+                                  description="Skip Amount",
+                                  default=0)
+
+    camera : bpy.props.BoolProperty(name="Watch Cam",
+                                    description="Set Current Camera to Watch Face Design Mode",
+                                    default=True)
+
+    def draw(self, context):
+        layout = self.layout
+        col = layout.column()
+        col.prop(self, "numbers")
+        if (self.numbers):
+            col.prop(self, "mins")
+            col.prop(self, "font")
+            col.prop(self, "show_bounds")
+            col.prop(self, 'extrude')
+            if (self.extrude):
+                col.prop(self, 'height')
+                col.prop(self, 'offset')
+                col.prop(self, 'depth')
+            col.prop(self, 'scale_factor')
+            col.prop(self, 'radius')
+            col.prop(self, 'padding')
+            col.prop(self, 'rotate')
+            if (self.rotate):
+                col.prop(self, 'readable')
+        col.separator()
+        col.prop(self, "ticks")
+        if (self.ticks):
+            col.prop(self, "tick_radius")
+            col.prop(self, "tick_count")
+            col.prop(self, "skip")
+            if (self.skip):
+                col.prop(self, 'skipa')
+        col.separator()
+        col.prop(self, "camera")
+
+    def execute(self, context):
+        coll = bpy.data.collections.new("WatchFace")
+        bpy.context.scene.collection.children.link(coll)
+
+        if self.ticks:
+            mesh = tick_ring_mesh(bpy.data.meshes.new("Ticks"), self.tick_radius, self.tick_count,
+                                  tick_mask(self.tick_count, self.skip, self.skipa))
+            obj = bpy.data.objects.new("Ticks", mesh)
+            coll.objects.link(obj)
+            obj.active_material = node_material("TicksMat")
+            obj.location = context.scene.cursor.location
+
+        if self.numbers:
+            placed = add_clock_numbers(context, coll, node_material("NumbersMat"),
+                                       load_font(self.font), self)
+            center_clock_numbers(context, placed)
+
+        if self.camera and not setup_watch_cam(context.scene):
+            self.report({'WARNING'}, "The scene has no camera")
+        return {'FINISHED'}
+
+
+class KTXLISSAJOUS_OT_Execute(KTXPolylineOutputProps, KTXAutoPeriodProps, bpy.types.Operator):
+    bl_idname = "ktxlissajous.execute"
+    bl_description = "Add a 3d Lissajous"
+    bl_label = "KTX Lissajous"
+    bl_options = {'REGISTER', 'UNDO'}
+
+    x_increment : bpy.props.FloatProperty(name="X Angle Increment",
+                                        description="X Angle Increment",
+                                        default=1.0)
+    y_increment : bpy.props.FloatProperty(name="Y Angle Increment",
+                                        description="Y Angle Increment",
+                                        default=1.4)
+    z_increment : bpy.props.FloatProperty(name="Z Angle Increment",
+                                         description="Z Angle Increment",
+                                         default=1.33)
+    count : bpy.props.IntProperty(name="Line Segment Count",
+                                      description="Edge Segments",
+                                      default=3600)
+    radius : bpy.props.FloatProperty(name="Radius",
+                                     description="Circle Radius",
+                                     default=2,precision=1, step=1)
+
+    def draw(self, context):
+        layout = self.layout
+        col = layout.column()
+        col.prop(self,"auto_period")
+        if (self.auto_period):
+            col.prop(self,"seglength")
+        else:
+            col.prop(self,"count")
+        col.prop(self,"radius")
+        self.draw_polyline(col)
+        col.prop(self,"x_increment")
+        col.prop(self,"y_increment")
+        col.prop(self,"z_increment")
+
+    def execute(self, context):
+        increments = np.array((self.x_increment, self.y_increment, self.z_increment))
+
+        def points(i):
+            angles = np.radians(np.multiply.outer(i, increments))
+            return np.stack((np.sin(angles[:, 0]), np.cos(angles[:, 1]),
+                             np.sin(angles[:, 2])), axis=-1) * self.radius
+
+        # sin(increment * i degrees) = sin(2pi * increment * i / 360), the
+        # period in samples is 360 times the common period of the increments
+        period = common_period(increments.tolist()) if self.auto_period else None
+        if period:
+            cycles = period * np.abs(increments).max()
+            i = sample_period(points, 360 * period, cycles, self.seglength)
+        else:
+            i = np.arange(self.count + 1)
+        verts = simplify_polyline(points(i), self.simplify, period is not None)
+
+        data = polyline_data('KTX_Lissajous', verts, self.output, period is not None,
+                             self.bevel_depth, self.extrude)
+        obj = bpy.data.objects.new('KTX_Lissajous', data)
+        bpy.context.scene.collection.objects.link(obj)
+        return {'FINISHED'}
+
+
+class KTXTOOLS_PT_Panel(bpy.types.Panel):
+    bl_label = "KosteX Tools"
+    bl_space_type = "VIEW_3D"
+    bl_region_type = "UI"
+    bl_category = "KTX"
+    bl_context = "objectmode"
+
+
+    def draw(self, context):
+        scn = context.scene
+        layout = self.layout
+        new_col = self.layout.column
+        new_col().column().operator("ktxtritangle.execute")
+        new_col().column().operator("wm.ktx_function")
+        new_col().column().operator("wm.ktx_cylinders")
+        new_col().column().operator("wm.ktx_cylinder_grid")
+        new_col().column().operator("wm.ktx_object_grid")
+        new_col().column().separator()
+        new_col().column().operator("wm.ktx_polar_array")
+        new_col().column().operator("wm.ktx_polar_array2")
+        new_col().column().operator("wm.ktx_clocknumbers")
+        new_col().column().operator("wm.ktx_clockticks")
+        new_col().column().separator()
+        new_col().column().operator("ktxspiralcircles.execute")
+        new_col().column().operator("wm.ktx_spirograph_2")
+        new_col().column().operator("ktxlissajous.execute")
+        new_col().column().operator("wm.ktx_add_random_cubes")
+        new_col().column().operator("wm.ktx_add_random_copies")
+#        new_col().column().separator()
+#        new_col().column().operator("wm.ktx_erase_all_materials")
+#        new_col().column().operator("wm.ktx_erase_unused_textures")
+#        new_col().column().operator("wm.ktx_erase_unused_palettes")
+        new_col().column().separator()
+#        new_col().column().operator("wm.ktx_add_subsurf_creases")
+        new_col().column().operator("wm.ktx_polish")
+        if polish_stats:
+            box = layout.box()
+            for name, seconds, verts in polish_stats:
+                box.label(text="%s: %.2fs, %d verts" % (name, seconds, verts))
+        new_col().column().separator()
+        new_col().column().operator("wm.ktx_assign_materials")
+        new_col().column().operator("wm.ktx_assign_random_diffuse_colors")
+#        new_col().column().operator("wm.ktx_add_glossy_mix_shaders")
+        new_col().column().operator("wm.ktx_set_viewport_color")
+        new_col().column().operator("wm.ktx_sync_viewport_colors")
+        new_col().column().separator()
+        new_col().column().operator("wm.ktx_setup_watchcam")
+        new_col().column().operator("wm.ktx_watchface")
+
+
+
+classes = (
+    KTXSPIRALCIRCLES_OT_Execute,
+    KTXTRITANGLE_OT_Execute,
+
+    KTXAssignRandomDiffuseColors,
+    KTXAddRandomCubes,
+    KTXAddRandomCopies,
+    KTXAssignMaterials,
+#    KTXAddGlossyMixShaders,
+#    KTXAddSubsurfCreases,
+    KTXSetViewportColor,
+    KTXSyncViewportColors,
+#    KTXEraseAllMaterials,
+#    KTXEraseUnusedTextures,
+#    KTXEraseUnusedPalettes,
+    KTXFunction,
+    KTXCylinders,
+    KTXCylinderGrid,
+    KTXObjectGrid,
+    KTXPolarArray,
+    KTXPolarArray2,
+    KTXClockNumbers,
+    KTXClockTicks,
+#    KTXPolarArray_old,
+    KTXPolish,
+    KTXSpiroGraph2,
+    KTXSetupWatchCam,
+    KTXWatchFace,
+    KTXLISSAJOUS_OT_Execute,
+    KTXTOOLS_PT_Panel
+)
+
+
+def register():
+    from bpy.utils import register_class
+
+    for cls in classes:
+        register_class(cls)
+
+
+def unregister():
+    from bpy.utils import unregister_class
+
+    for cls in classes:
+        unregister_class(cls)
+    shutdown_tiled_pool()
+
+
+if __name__ == "__main__":
+    register()
@@ -0,0 +1,161 @@
+# ##### BEGIN GPL LICENSE BLOCK #####
+#
+#  This program is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU General Public License
+#  as published by the Free Software Foundation; either version 2
+#  of the License, or (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public License
+#  along with this program; if not, write to the Free Software Foundation,
+#  Inc., 51 Franklin Street, Fifth Floor, Boston, MA 02110-1301, USA.
+#
+# ##### END GPL LICENSE BLOCK #####
+
+# Expression helpers of the KTX Tools add-on. Kept apart from it, without
+# bpy, so the worker processes of the KTX Function "Multi Process" option
+# can import them
+
+import math
+import random
+import sys
+import ast
+import functools
+import numpy as np
+
+
+# math.* names mapped onto their numpy array equivalents, so expressions
+# written for the scalar math module can be evaluated on whole arrays
+NP_MATH = type('NumpyMath', (), {
+    'pi': math.pi, 'e': math.e, 'tau': 2 * math.pi, 'inf': math.inf,
+    'sin': np.sin, 'cos': np.cos, 'tan': np.tan,
+    'asin': np.arcsin, 'acos': np.arccos, 'atan': np.arctan, 'atan2': np.arctan2,
+    'sinh': np.sinh, 'cosh': np.cosh, 'tanh': np.tanh,
+    'asinh': np.arcsinh, 'acosh': np.arccosh, 'atanh': np.arctanh,
+    'exp': np.exp, 'log': np.log, 'log2': np.log2, 'log10': np.log10,
+    'sqrt': np.sqrt, 'pow': np.power, 'hypot': np.hypot,
+    'fabs': np.fabs, 'floor': np.floor, 'ceil': np.ceil, 'fmod': np.fmod,
+    'degrees': np.degrees, 'radians': np.radians})
+
+
+# Expressions typed in the operator panels (KTX Function, Spirograph) are
+# checked against a whitelist once, compiled and kept in an LRU cache, so
+# redo and per sample evaluation pay no parse cost
+EXPR_BUILTINS = {'abs': abs, 'min': min, 'max': max, 'pow': pow,
+                 'round': round, 'int': int, 'float': float}
+EXPR_MODULES = {'math': math, 'np': np, 'numpy': np, 'random': random}
+EXPR_GLOBALS = dict(EXPR_MODULES, __builtins__=EXPR_BUILTINS)
+EXPR_NODES = (ast.Expression, ast.BinOp, ast.UnaryOp, ast.BoolOp, ast.Compare,
+              ast.IfExp, ast.Call, ast.keyword, ast.Name, ast.Attribute,
+              ast.Constant, ast.Load, ast.operator, ast.unaryop, ast.cmpop,
+              ast.boolop)
+if sys.version_info < (3, 8):
+    EXPR_NODES += (ast.Num,)
+
+# the only module attributes an expression may use, one level deep
+MATH_NAMES = {name for name in vars(NP_MATH) if not name.startswith('_')} | {
+    'copysign', 'trunc', 'expm1', 'log1p', 'erf', 'erfc', 'gamma', 'lgamma',
+    'factorial', 'gcd'}
+NUMPY_NAMES = {
+    'pi', 'e', 'inf', 'sin', 'cos', 'tan', 'arcsin', 'arccos', 'arctan', 'arctan2',
+    'sinh', 'cosh', 'tanh', 'arcsinh', 'arccosh', 'arctanh',
+    'exp', 'exp2', 'expm1', 'log', 'log2', 'log10', 'log1p',
+    'sqrt', 'cbrt', 'square', 'power', 'hypot', 'abs', 'absolute', 'fabs', 'sign',
+    'floor', 'ceil', 'trunc', 'rint', 'round', 'mod', 'fmod', 'remainder',
+    'degrees', 'radians', 'deg2rad', 'rad2deg', 'minimum', 'maximum', 'fmin', 'fmax',
+    'clip', 'where', 'sinc'}
+RANDOM_NAMES = {'random', 'uniform', 'randint', 'randrange', 'triangular', 'gauss',
+                'normalvariate', 'lognormvariate', 'expovariate', 'vonmisesvariate',
+                'gammavariate', 'betavariate', 'paretovariate', 'weibullvariate'}
+EXPR_ATTRIBUTES = {'math': MATH_NAMES, 'np': NUMPY_NAMES, 'numpy': NUMPY_NAMES,
+                   'random': RANDOM_NAMES}
+
+
+@functools.lru_cache(maxsize=64)
+def compile_expression(text, variables):
+    try:
+        tree = ast.parse(text.strip(), mode='eval')
+    except SyntaxError as err:
+        raise ValueError("Invalid expression '%s': %s" % (text, err.msg))
+    names = set(variables) | set(EXPR_BUILTINS) | set(EXPR_MODULES)
+    roots = set()
+    for node in ast.walk(tree):
+        if not isinstance(node, EXPR_NODES):
+            raise ValueError("'%s' is not allowed in '%s'" % (type(node).__name__, text))
+        if isinstance(node, ast.Name):
+            if node.id not in names:
+                raise ValueError("Unknown name '%s' in '%s'" % (node.id, text))
+            # modules are only usable through one of their allowed attributes
+            if node.id in EXPR_MODULES and id(node) not in roots:
+                raise ValueError("'%s' can only be used as %s.<name> in '%s'" % (node.id, node.id, text))
+        if isinstance(node, ast.Attribute):
+            module = node.value.id if isinstance(node.value, ast.Name) else None
+            if node.attr not in EXPR_ATTRIBUTES.get(module, ()):
+                raise ValueError("Attribute '%s' is not allowed in '%s'" % (node.attr, text))
+            roots.add(id(node.value))
+        if isinstance(node, ast.Constant) and not isinstance(node.value, (int, float, complex)):
+            raise ValueError("Only numeric constants are allowed in '%s'" % text)
+        if isinstance(node, ast.keyword) and node.arg is None:
+            raise ValueError("Keyword unpacking is not allowed in '%s'" % text)
+    return compile(tree, '<KTX expression>', 'eval')
+
+
+# numpy math errors raise like the math module does, so a domain error
+# fails the same way on the vectorized and on the per point path
+EXPR_ERRSTATE = dict(divide='raise', over='raise', invalid='raise', under='ignore')
+
+
+def eval_expression(code, **values):
+    try:
+        return eval(code, EXPR_GLOBALS, values)
+    except (ArithmeticError, ValueError, TypeError) as err:
+        where = ", ".join("%s=%g" % item for item in values.items())
+        raise ValueError("Can't evaluate the expression at %s: %s" % (where, err))
+
+
+def eval_vectorized(code, **arrays):
+    # Evaluate code once over whole numpy arrays, returns None when the
+    # expression can't be vectorized (branches, scalar only functions, ...)
+    # or fails, the per point evaluation then reports the error. random.*
+    # has to draw a new sample per point, so it is never vectorized
+    if 'random' in code.co_names:
+        return None
+    shape = np.broadcast(*arrays.values()).shape
+    names = {'math': NP_MATH}
+    names.update(arrays)
+    try:
+        with np.errstate(**EXPR_ERRSTATE):
+            result = np.asarray(eval(code, EXPR_GLOBALS, names), dtype=np.float64)
+        return np.broadcast_to(result, shape)
+    except Exception:
+        return None
+
+
+def eval_points(text, x, y):
+    # Per point evaluation over the coordinate arrays x and y
+    code = compile_expression(text, ('x', 'y'))
+    x, y = np.broadcast_arrays(x, y)
+    with np.errstate(**EXPR_ERRSTATE):
+        return np.array([eval_expression(code, x=float(u), y=float(v))
+                         for u, v in zip(x.ravel(), y.ravel())]).reshape(x.shape)
+
+
+# The band functions run in the worker processes of evaluate_tiled. They get
+# the expression text and the lattice that spans their band, the compiled
+# code comes from the worker's cache and the coordinates are rebuilt here as
+# start + step * (i, j)
+
+def eval_rows(text, start, step, columns, rows):
+    # rows range(*rows) of a grid columns wide
+    x = start[0] + step[0] * np.arange(columns)
+    y = start[1] + step[1] * np.arange(*rows)
+    return eval_points(text, x[None, :], y[:, None])
+
+
+def eval_lattice(text, start, step, i, j):
+    # the scattered lattice points i, j
+    return eval_points(text, start[0] + step[0] * i, start[1] + step[1] * j)